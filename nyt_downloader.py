@@ -1,37 +1,65 @@
 import os
 import threading
+import csv
+import itertools
+import queue
+from collections import deque, ChainMap
+import copy
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor, wait
 import tkinter as tk, tkinter.ttk as ttk
 from tkinter import filedialog, messagebox, scrolledtext
 import yt_dlp as youtube_dl
-import queue
 import shutil
 import sys
-import json
+import time
 #customize importing TKToolTip according to your system
 if os.name == "nt":
     from tktooltip import ToolTip
 else:
     from TkToolTip import ToolTip
-import pandas as pd
+import openpyxl
 from pystray import Icon as TrayIcon, MenuItem as item, Menu
 from PIL import Image
 import settingsWindow
 
+QUEUE_REFRESH_BATCH = 500  # Rows added to the queue between two table refreshes while bulk loading
+QUEUE_REFRESH_DELAY_MS = 100  # Coalescing window for queue table refresh requests
+PROGRESS_REFRESH_INTERVAL = 0.2  # Seconds between two table refreshes for one download's progress
+WORKER_JOIN_TIMEOUT = 2.0  # Seconds the app waits after its window closed, in total, before ending downloads still running
+MAX_LOG_LINES = 5000  # Lines kept in the log window, older ones are dropped
+LOG_TRIM_SLACK = 500  # Extra lines allowed before trimming, so trims happen in chunks
+ASSETS_DIR = "Assets"
+LOGO_PATH = os.path.join(ASSETS_DIR, "logo.ico")  # Window and tray icon
+ICONS = {  # Button icon name -> file in the Assets folder
+    "export": "Export.png",
+    "clear": "clear.png",
+    "search": "search.png",
+    "refresh": "refresh.png",
+    "settings": "settings.png",
+    "import": "import.png",
+}
+STATUS_COLORS = {"Queued": "gray", "Downloading": "blue", "Completed": "green", "Failed": "red"}  # Task status -> queue table tag
+LOG_COLORS = {"info": "white", "success": "lightgreen", "warning": "orange", "error": "red"}  # Log level -> text color
+
+FFMPEG_INSTALL_COMMANDS = {  # sys.platform -> (system name, FFmpeg install command) shown when FFmpeg is missing
+    "win32": ("Windows", "winget install --id Gyan.FFmpeg -e --accept-package-agreements --accept-source-agreements"),
+    "darwin": ("macOS", "brew install ffmpeg"),
+    "linux": ("Linux (Debian/Ubuntu)", "sudo apt update && sudo apt install ffmpeg"),
+}
+
 def check_and_install_ffmpeg():
     """Check if FFmpeg is installed; if not, provide terminal commands for installation."""
     if shutil.which("ffmpeg") is None:  # Check if FFmpeg exists in system path
+        # Only this system's command when it is known, every command otherwise
+        commands = [FFMPEG_INSTALL_COMMANDS[sys.platform]] if sys.platform in FFMPEG_INSTALL_COMMANDS else FFMPEG_INSTALL_COMMANDS.values()
         messagebox.showinfo(
             "FFmpeg Not Found",
             "FFmpeg is not installed.\n"
             "It is required for this app to work properly.\n\n"
             "To install FFmpeg, run the following commands in your terminal or command prompt:\n\n"
-            "For Windows:\n"
-            "winget install ffmpeg\n\n"
-            "For macOS:\n"
-            "brew install ffmpeg\n\n"
-            "For Linux (Debian/Ubuntu):\n"
-            "sudo apt update && sudo apt install ffmpeg\n\n"
-            "Restart the app after installation."
+            + "".join(f"For {system}:\n{command}\n\n" for system, command in commands)
+            + "Restart the app after installation."
         )
         sys.exit(0)  # Exit the script to allow user to install FFmpeg
     else:
@@ -45,7 +73,7 @@ class DownloaderApp:
         self.master = master
         master.title("NYT Downloader")
         try:
-            master.iconbitmap("Assets/logo.ico")
+            master.iconbitmap(LOGO_PATH)
         except:
             pass
         if os.name == "nt":  # Check if the operating system is Windows
@@ -54,53 +82,81 @@ class DownloaderApp:
             pass
         master.protocol("WM_DELETE_WINDOW", self.close_application)
         self.download_directory = ""
-        self.queue = []  # Store download items
+        self.queue = deque()  # Store download items, producers only ever append
+        self.task_by_iid = {}  # Treeview row id -> task, rebuilt on every refresh
+        self.task_ids = itertools.count()  # Source of task["uid"], the task's row id in the queue table
+        self.rendered_rows = {}  # Treeview row id -> values last written to that row
         self.handy_widgets = {}
         self.is_loading = False  # Flag to prevent recursive loading
+        self.handy_save_pending = False  # An idle save of the handy settings is already scheduled
         self.preset_dir = "settings_presets"
-        self.download_queue = queue.Queue()  # Queue for managing tasks
         self.max_threads = 4  # Limit concurrent downloads
+        # Long-lived worker pool so every batch reuses the same warm threads
+        self.pool = ThreadPoolExecutor(max_workers=self.max_threads, thread_name_prefix="dl")
+        self.futures = []
+        self.io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="io")  # Preset file reads off the Tk thread
+        self.active_count = 0  # download_task calls running right now, read instead of scanning the queue
+        self.active_lock = threading.Lock()  # Guards active_count, updated from the pool threads
+        self.submitted = set()  # id() of tasks handed to the pool that have not started yet
+        # Each pool thread keeps its own YoutubeDL per distinct option set (YoutubeDL is not thread-safe)
+        self.thread_state = threading.local()
+        self.ydl_instances = []  # Every cached YoutubeDL, so they can be closed on shutdown
+        self.last_refresh = {}  # id() of a downloading task -> monotonic time of its last table refresh, kept out of the task itself
+        self.ydl_tasks = {}  # Cached YoutubeDL -> the task it downloads now, read by its progress hook
+        self.ydl_busy = set()  # Cached YoutubeDLs a pool thread is downloading with right now, never closed by shutdown()
+        self.ydl_lock = threading.Lock()  # Guards ydl_instances, ydl_tasks and ydl_busy, used from the pool threads and the Tk thread
+        self.closing = False  # close_application is running or done, later calls return at once
+        self.tray_icon = None  # pystray icon, created on the first minimize and hidden while the window is shown
+        self.workers = set()  # Background threads started by start_worker that are still running
+        self.shutdown_event = threading.Event()  # Set by shutdown(), workers check it to stop early
+        self.queue_refresh_pending = False  # A queue table refresh is already scheduled
+        self.log_messages = queue.SimpleQueue()  # (message, level) pairs from any thread waiting to be written to the log window
+        self.log_flush_pending = False  # A flush of log_messages is already scheduled
         self.preset_dir = "settings_presets"
         try:
-            with open(f"{self.preset_dir}/default.json", "r") as f:
-                self.global_ydl_opts = json.load(f)  # Load global options from JSON file
+            self.global_ydl_opts = copy.deepcopy(self.load_preset("default"))  # Load global options from JSON file
         except FileNotFoundError:
             self.global_ydl_opts = {}  # Initialize with empty options if file not found
-        try:
-            self.export_image = tk.PhotoImage(file="Assets/Export.png")
-            self.clear_image = tk.PhotoImage(file="Assets/clear.png")
-            self.search_image = tk.PhotoImage(file="Assets/search.png")
-            self.refresh_image = tk.PhotoImage(file="Assets/refresh.png")
-            self.settings_image = tk.PhotoImage(file="Assets/settings.png")
-            self.import_image = tk.PhotoImage(file="Assets/import.png")
-        except tk.TclError as e:
-            messagebox.showerror("Error", f"Failed to load images: {e}\nEnsure the 'Assets' folder exists and contains the required image files.")
-            sys.exit()
-        self.format_options = {
-            "All Available Formats": "all",
-            "Best (Video+Audio)": "best",
-            "Best Video+Audio (Muxed)": "bv*+ba/best",
-            "Best ≤720p": "bestvideo[height<=720]+bestaudio/best[height<=720]",
-            "Best ≤480p": "bestvideo[height<=480]+bestaudio/best[height<=480]",
-            "Worst Video+Audio (Muxed)": "worst",
-            "Best Video Only": "bestvideo",
-            "Worst Video Only": "worstvideo",
-            "Best Video (any stream)": "bestvideo*",
-            "Worst Video (any stream)": "worstvideo*",
-            "Best Audio Only": "bestaudio",
-            "Worst Audio Only": "worstaudio",
-            "Best Audio (any stream)": "bestaudio*",
-            "Worst Audio (any stream)": "worstaudio*",
-            "Smallest File": "best -S +size,+br,+res,+fps",
-        }
+        self.global_opts_snapshot = copy.deepcopy(self.global_ydl_opts)  # Frozen copy of global_ydl_opts shared by new tasks, replaced by global_options_changed
+        self.global_opts_digest = None  # settingsWindow.options_digest() of global_ydl_opts, computed on demand
+        self.last_handy_state = None  # Handy widget values last written into global_ydl_opts
+        # Load the button icons as self.<name>_image, a missing one becomes a blank image instead of stopping the app
+        for name, file_name in ICONS.items():
+            try:
+                image = tk.PhotoImage(file=os.path.join(ASSETS_DIR, file_name))
+            except tk.TclError as e:
+                self.log(f"⚠️ Failed to load icon {file_name}: {e}", level="warning")
+                image = tk.PhotoImage(width=16, height=16)
+            setattr(self, f"{name}_image", image)
+        self.format_options = settingsWindow.FORMAT_OPTIONS  # Same labels as the settings window, never mutated
 
         self.video_exts = ["mp4", "webm", "mkv", "flv", "avi"]
         self.audio_exts = ["mp3", "m4a", "aac", "wav", "ogg", "opus"]
-        self.categories = [
-            "sponsor", "intro", "outro", "selfpromo", "interaction",
-            "music_offtopic", "preview", "filler", "exclusive_access",
-            "poi_highlight", "poi_nonhighlight"
-        ]
+        # Final extension choices per format category, built once for update_format_entry
+        self.format_ext_options = {
+            "audio": ("original", *self.audio_exts),
+            "video": ("original", *self.video_exts),
+            "mixed": ("original", *self.video_exts, *self.audio_exts),
+        }
+        self.format_labels = tuple(self.format_options)
+        self.format_category = {}
+        for label in self.format_labels:
+            if "Audio" in label and "Video" not in label:
+                self.format_category[label] = "audio"
+            elif "Video" in label or "Quality" in label or "MP4" in label:
+                self.format_category[label] = "video"
+            else:
+                self.format_category[label] = "mixed"
+        # Immutable; options always receive their own list(self.categories)
+        self.categories = settingsWindow.SB_CATEGORIES  # The settings window's list, so the two never drift apart
+        self.categories_set = frozenset(self.categories)  # Order-independent "all categories" check
+        # Read-only postprocessor templates for the quick settings, copied only when one is inserted
+        self.pp_templates = MappingProxyType({
+            "FFmpegMetadata": MappingProxyType({"key": "FFmpegMetadata", "add_metadata": True, "add_chapters": True}),
+            "SponsorBlock": MappingProxyType({"key": "SponsorBlock", "categories": self.categories, "when": 'after_filter'}),
+            "EmbedThumbnail": MappingProxyType({"key": "EmbedThumbnail"}),
+            "FFmpegEmbedSubtitle": MappingProxyType({"key": "FFmpegEmbedSubtitle"}),
+        })
         self.create_widgets()
         self.master.bind("<F2>", self.open_settings_window_for_selected)  # F2 Key for settings
 
@@ -126,21 +182,41 @@ class DownloaderApp:
 
         # Create a frame inside the canvas to hold the widgets
         self.left_frame = tk.Frame(self.left_canvas, bg="lightgray")
-        self.left_canvas.create_window((0, 0), window=self.left_frame, anchor="nw")  # Anchor to the top-left corner
+        self.left_window_id = self.left_canvas.create_window((0, 0), window=self.left_frame, anchor="nw")  # Anchor to the top-left corner
 
         # Bind the canvas to resize and scroll properly
-        def update_scroll_region(event=None):
+        self.scroll_region_job = None  # Pending update_scroll_region call
+        self.scroll_geometry = None  # (frame height, canvas height, frame width) at the last update
+        self.left_scrollbar_shown = None  # Unknown until the first update
+        # The wheel is bound once, update_scroll_region only turns it on or off
+        self.left_wheel_enabled = False
+        self.left_canvas.bind_all("<MouseWheel>", self.on_left_wheel)
+        def update_scroll_region():
+            self.scroll_region_job = None
+            geometry = (self.left_frame.winfo_height(), self.left_canvas.winfo_height(), self.left_frame.winfo_width())
+            if geometry == self.scroll_geometry:
+                return  # Nothing that affects scrolling changed
+            self.scroll_geometry = geometry
             self.left_canvas.configure(scrollregion=self.left_canvas.bbox("all"))
-            if self.left_frame.winfo_height() <= self.left_canvas.winfo_height():
-                self.left_canvas.unbind_all("<MouseWheel>")
+            needs_scrollbar = geometry[0] > geometry[1]
+            if needs_scrollbar == self.left_scrollbar_shown:
+                return  # Only touch the scrollbar and wheel binding when that state flips
+            self.left_scrollbar_shown = needs_scrollbar
+            self.left_wheel_enabled = needs_scrollbar
+            if not needs_scrollbar:
                 self.left_scrollbar.pack_forget()
             else:
-                #re-enable Scrollbar and bind mouse wheel event
-                self.left_canvas.bind_all("<MouseWheel>", lambda e: self.left_canvas.yview_scroll(int(-1 * (e.delta / 120)), "units"))
+                #re-enable Scrollbar, the mouse wheel follows left_wheel_enabled
                 self.left_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        self.master.bind("<Configure>", update_scroll_region)
-        self.left_canvas.bind("<Configure>", lambda e: self.left_canvas.itemconfig(self.left_canvas.find_withtag("all")[0], width=e.width))
+        def schedule_scroll_region_update(event=None):
+            #<Configure> fires for every widget in the window while resizing, update once it settles
+            if self.scroll_region_job is not None:
+                self.master.after_cancel(self.scroll_region_job)
+            self.scroll_region_job = self.master.after(50, update_scroll_region)
+
+        self.master.bind("<Configure>", schedule_scroll_region_update)
+        self.left_canvas.bind("<Configure>", lambda e: self.left_canvas.itemconfig(self.left_window_id, width=e.width))
 
         self.main_right_frame = tk.PanedWindow(self.panedwindow, width=300, orient=tk.VERTICAL, bg="lightgray")
         self.main_right_frame.pack(fill=tk.BOTH, expand=1)
@@ -180,16 +256,16 @@ class DownloaderApp:
             """Highlight search results in the log text."""
             self.log_text.tag_remove("highlight", "1.0", tk.END)  # Remove previous highlights
             query = search_entry.get().strip()
-            if query:
-                start_pos = "1.0"
-            while True:
-                start_pos = self.log_text.search(query, start_pos, stopindex=tk.END, nocase=True)
-                if not start_pos:
-                    break
-                end_pos = f"{start_pos}+{len(query)}c"
-                self.log_text.tag_add("highlight", start_pos, end_pos)
-                start_pos = end_pos
-            self.log_text.tag_config("highlight", background="yellow", foreground="black")
+            if not query:
+                return
+            # A single Tk search returns every match, then one tag_add highlights them all
+            starts = self.log_text.tk.splitlist(
+                self.log_text.tk.call(str(self.log_text), "search", "-all", "-nocase", "--", query, "1.0", tk.END))
+            ranges = []
+            for start in starts:
+                ranges += (start, f"{start}+{len(query)}c")
+            if ranges:
+                self.log_text.tag_add("highlight", *ranges)
 
         search_button = tk.Button(log_controls_frame, command=search_logs,image=self.search_image,borderwidth=0,relief="flat",bg="lightgray")
         search_button.pack(side=tk.LEFT, padx=5, pady=5)
@@ -197,6 +273,10 @@ class DownloaderApp:
         # Log text area with scroll
         self.log_text = scrolledtext.ScrolledText(log_frame, bg="#222", fg="white", font=("Consolas", 10), wrap=tk.WORD)
         self.log_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        # Configure the level tags once, log() only has to insert
+        for level, color in LOG_COLORS.items():
+            self.log_text.tag_config(level, foreground=color)
+        self.log_text.tag_config("highlight", background="yellow", foreground="black")
         # Enable Ctrl+A to select all text in the log area
         self.log_text.bind("<Control-a>", lambda e: self.log_text.tag_add("sel", "1.0", tk.END) or "break")        
         # Block other editing but allow specific key combinations
@@ -245,12 +325,13 @@ class DownloaderApp:
         # Preset Dropdown
         tk.Label(handy_frame, text="Select Preset:", font=("Arial", 10)).grid(row=0, column=0, padx=5, sticky="w")
         self.preset_var = tk.StringVar()
-        self.preset_dropdown = ttk.Combobox(handy_frame, textvariable=self.preset_var, state="readonly")
+        # postcommand rescans the folder each time the list opens, so presets saved or copied in later show up
+        self.preset_dropdown = ttk.Combobox(handy_frame, textvariable=self.preset_var, state="readonly", postcommand=self.refresh_preset_dropdown)
         self.preset_dropdown.grid(row=0, column=1, padx=10, pady=5, sticky="ew")
         self.preset_dropdown.bind("<<ComboboxSelected>>", self.on_preset_selected)
-        files = [f[:-5] for f in os.listdir(self.preset_dir) if f.endswith(".json")]
-        self.preset_dropdown["values"] = files + ["New/Unsaved"]
-        if "default" in files:
+        preset_names = settingsWindow.list_preset_names(self.preset_dir)
+        self.preset_dropdown["values"] = (*preset_names, "New/Unsaved")
+        if "default" in preset_names:
             self.preset_dropdown.set("default")
         else:
             self.preset_dropdown.set("New/Unsaved")
@@ -261,27 +342,21 @@ class DownloaderApp:
          # Sync dropdown and entry
         def update_format_entry(event=None):
             selected_label = self.format_var.get()
-            # Adapt final extension options
-            if "Audio" in selected_label and not "Video" in selected_label:
-                self.handy_widgets['final_ext']['values'] = ["original"] + self.audio_exts
-                self.handy_widgets['final_ext'].set("original")  # Set default to "original"
-            elif "Video" in selected_label or "Quality" in selected_label or "MP4" in selected_label:
-                self.handy_widgets['final_ext']['values'] = ["original"] + self.video_exts
-                self.handy_widgets['final_ext'].set("original")  # Set default to "original"
-            else:
-                self.handy_widgets['final_ext']['values'] = ["original"] + self.video_exts + self.audio_exts  # fallback
-                self.handy_widgets['final_ext'].set("original")  # Set default to "original"
+            # Adapt final extension options, unknown labels fall back to every extension
+            category = self.format_category.get(selected_label, "mixed")
+            self.handy_widgets['final_ext']['values'] = self.format_ext_options[category]
+            self.handy_widgets['final_ext'].set("original")  # Set default to "original"
 
         # Format Dropdown
         self.format_var = tk.StringVar(value="Best Video+Audio (Muxed)")
-        self.handy_widgets["format_dropdown"] = ttk.Combobox(master=handy_frame, textvariable=self.format_var, values=list(self.format_options.keys()),state="readonly")
+        self.handy_widgets["format_dropdown"] = ttk.Combobox(master=handy_frame, textvariable=self.format_var, values=self.format_labels,state="readonly")
         self.handy_widgets["format_dropdown"].grid(row=1, column=1, padx=10, pady=5, sticky="ew")
         self.handy_widgets['format_dropdown'].bind("<<ComboboxSelected>>", update_format_entry)
         ToolTip(self.handy_widgets["format_dropdown"], msg="Select a format for the download.\n Please select Any stream format if face format error.\n Also you can manually type any legal format in settings Window.\nIt will automatically adapt the final extension options.", delay=0.5)
 
         #final Extension Dropdown
         tk.Label(handy_frame, text="Select Extension:", font=("Arial", 10)).grid(row=2, column=0, padx=5, sticky="w")
-        final_ext_options = ["original"] + self.video_exts
+        final_ext_options = self.format_ext_options["video"]
         self.final_ext_var = tk.StringVar(value="original")
         self.handy_widgets["final_ext"] = ttk.Combobox(master=handy_frame, textvariable=self.final_ext_var, values=final_ext_options, state="readonly")
         self.handy_widgets["final_ext"].grid(row=2, column=1, padx=10, pady=5, sticky="ew")
@@ -325,13 +400,19 @@ class DownloaderApp:
         ToolTip(self.Other_radio, msg="Custom Sponserblock settings.\n If not any preset selected and not opted anything,\n in Settings window it sets to do nothing.", delay=0.5)
 
         #binding save_handy_settings_into_global to all handy_settings widgets
-        self.format_var.trace_add("write", lambda *args: self.save_handy_settings_into_global())
-        self.final_ext_var.trace_add("write", lambda *args: self.save_handy_settings_into_global())
-        self.embed_thumbnail_var.trace_add("write", lambda *args: self.save_handy_settings_into_global())
-        self.metadata_var.trace_add("write", lambda *args: self.save_handy_settings_into_global())
-        self.sponserblock_var.trace_add("write", lambda *args: self.save_handy_settings_into_global())
-        self.embed_subtitles_var.trace_add("write", lambda *args: self.save_handy_settings_into_global())
-        self.writeautomaticsub_var.trace_add("write", lambda *args: self.save_handy_settings_into_global())
+        #each trace also records the new value, so saving reads a dict instead of querying every Tk variable
+        handy_vars = {
+            "format": self.format_var,
+            "final_ext": self.final_ext_var,
+            "embed_thumbnail": self.embed_thumbnail_var,
+            "metadata": self.metadata_var,
+            "sponserblock": self.sponserblock_var,
+            "embed_subtitles": self.embed_subtitles_var,
+            "writeautomaticsub": self.writeautomaticsub_var,
+        }
+        self.handy_values = {name: var.get() for name, var in handy_vars.items()}
+        for name, var in handy_vars.items():
+            var.trace_add("write", lambda *args, name=name, var=var: self.on_handy_var_changed(name, var))
 
         # Load settings from global_ydl_opts into handy widgets
         if self.global_ydl_opts != {}:
@@ -341,11 +422,11 @@ class DownloaderApp:
 
         # Save settings to global_ydl_opts button
         tk.Label(handy_frame, text="If not autosaved :", font=("Arial", 10)).grid(row=9, column=0, padx=5, sticky="w")
-        tk.Button(handy_frame, text="💾 Save Settings", command=self.save_handy_settings_into_global, bg="#007bff", fg="white", font=("Arial", 10)).grid(row=9, column=1, padx=10, pady=5, sticky="ew")
+        tk.Button(handy_frame, text="💾 Save Settings", command=lambda: self.save_handy_settings_into_global(force=True), bg="#007bff", fg="white", font=("Arial", 10)).grid(row=9, column=1, padx=10, pady=5, sticky="ew")
         # ⚙️ Full Settings Button
-        self.settings_button = tk.Button(handy_frame, text="⚙️ Full Settings", command=self.open_settings_window, bg="#007bff", fg="white", font=("Arial", 10))
-        ToolTip(self.settings_button, msg="Click to open the full settings window.\n You can customize various options for downloads.\n It will be saved as default template.\n press F2 as shortcut can edit individual task settings via it also.", delay=0.5)
-        self.settings_button.grid(row=10, column=0,columnspan=2, padx=5, pady=5,sticky="ew")
+        self.full_settings_button = tk.Button(handy_frame, text="⚙️ Full Settings", command=self.open_settings_window, bg="#007bff", fg="white", font=("Arial", 10))
+        ToolTip(self.full_settings_button, msg="Click to open the full settings window.\n You can customize various options for downloads.\n It will be saved as default template.\n press F2 as shortcut can edit individual task settings via it also.", delay=0.5)
+        self.full_settings_button.grid(row=10, column=0,columnspan=2, padx=5, pady=5,sticky="ew")
 
         # Section: Actions
         actions_frame = tk.LabelFrame(self.left_frame, text="⚡ Actions", font=("Arial", 10, "bold"))
@@ -380,6 +461,12 @@ class DownloaderApp:
         self.queue_table.column("Status", width=100, anchor="center")
         self.queue_table.column("Progress", width=150, anchor="center")  # ✅ Progress column
 
+        # Status color tags, configured once here instead of on every refresh
+        self.queue_table.tag_configure("gray", foreground="gray")
+        self.queue_table.tag_configure("blue", foreground="blue")
+        self.queue_table.tag_configure("green", foreground="green")
+        self.queue_table.tag_configure("red", foreground="red")
+
         # Add Scrollbar
         scrollbar = ttk.Scrollbar(queue_frame, orient=tk.VERTICAL, command=self.queue_table.yview)
         self.queue_table.configure(yscroll=scrollbar.set)
@@ -408,9 +495,9 @@ class DownloaderApp:
         self.clear_button.pack(side=tk.LEFT, padx=10)
         ToolTip(self.clear_button, msg="Clear\nClear all items from the download queue if none are selected, or clear only the selected items.\nNote: This action cannot be undone.", delay=0.5)
 
-        self.settings_button = tk.Button(button_frame, image=self.settings_image, command=self.open_settings_window_for_selected, borderwidth=0, relief="flat")
-        self.settings_button.pack(side=tk.LEFT, padx=10)
-        ToolTip(self.settings_button, msg="⚙️ Settings (F2)\nOpen settings for the selected item(s) in the queue.\nIf more than one item is selected, it changes settings for all in common.\nIf no item is selected, it opens Global settings.\nYou can customize various options for specific downloads.", delay=0.5)
+        self.selected_settings_button = tk.Button(button_frame, image=self.settings_image, command=self.open_settings_window_for_selected, borderwidth=0, relief="flat")
+        self.selected_settings_button.pack(side=tk.LEFT, padx=10)
+        ToolTip(self.selected_settings_button, msg="⚙️ Settings (F2)\nOpen settings for the selected item(s) in the queue.\nIf more than one item is selected, it changes settings for all in common.\nIf no item is selected, it opens Global settings.\nYou can customize various options for specific downloads.", delay=0.5)
         
         # Grid the Treeview and Scrollbar properly
         self.queue_table.grid(row=0, column=0, sticky="nsew")   # Fill available space
@@ -428,23 +515,58 @@ class DownloaderApp:
         self.queue_table.bind("<Delete>", self.del_key)  # Delete Key
         self.queue_table.bind("backspace", self.del_key)  # Backspace Key
 
-    def save_handy_settings_into_global(self):
+    def on_left_wheel(self, event):
+        """Scroll the left panel with the mouse wheel while it has a scrollbar."""
+        if self.left_wheel_enabled:
+            self.left_canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+
+    def global_options_changed(self):
+        """Forget everything derived from global_ydl_opts after it was edited or replaced (Tk thread only)."""
+        # Copied here, where global_ydl_opts changes, so worker threads never copy a dict the Tk thread is editing
+        self.global_opts_snapshot = copy.deepcopy(self.global_ydl_opts)
+        self.global_opts_digest = None
+        self.last_handy_state = None
+
+    def new_task_opts(self):
+        """Options for a new task: an empty overlay on a snapshot of the global options (any thread)."""
+        #tasks share one snapshot and only pay for the keys they change themselves
+        return ChainMap({}, self.global_opts_snapshot)
+
+    def on_handy_var_changed(self, name, var):
+        """Record a handy widget's new value, then schedule one idle save for all changes made meanwhile."""
+        self.handy_values[name] = var.get()  # Recorded even while loading, so the snapshot never goes stale
+        if self.is_loading or self.handy_save_pending:
+            return
+        self.handy_save_pending = True
+        self.master.after_idle(self.flush_handy_save)
+
+    def flush_handy_save(self):
+        """Run the handy settings save scheduled by on_handy_var_changed."""
+        self.handy_save_pending = False
+        self.save_handy_settings_into_global()
+
+    def save_handy_settings_into_global(self, force=False):
         """Save settings from the handy widgets into global_ydl_opts."""
         if self.is_loading:
             return
-        #get postprocessors from global_ydl_opts
-        postprocessors = self.global_ydl_opts.get('postprocessors', [])
-        selected_label = self.format_var.get()
+        #skip the rebuild when a trace fired but no handy value actually changed
+        state = tuple(self.handy_values.values())
+        if state == self.last_handy_state and not force:
+            return
+        #get postprocessors from global_ydl_opts, keyed by 'key' so each one is a single lookup
+        pp_map = {pp["key"]: pp for pp in self.global_ydl_opts.get('postprocessors', []) if "key" in pp}
+        handy = self.handy_values
+        selected_label = handy["format"]
         value = self.format_options.get(selected_label, "Custom")
-        selected_ext = self.final_ext_var.get()
-        embed_thumbnail = self.embed_thumbnail_var.get()
-        add_metadata = self.metadata_var.get()
+        selected_ext = handy["final_ext"]
+        embed_thumbnail = handy["embed_thumbnail"]
+        add_metadata = handy["metadata"]
         # Sponserblock
-        sponserblock = self.sponserblock_var.get()
+        sponserblock = handy["sponserblock"]
         #embeded Subs
-        embed_subtitles = self.embed_subtitles_var.get()
+        embed_subtitles = handy["embed_subtitles"]
         #writeautomaticsub
-        writeautomaticsub = self.writeautomaticsub_var.get()
+        writeautomaticsub = handy["writeautomaticsub"]
 
         # Update global options based on selection
         self.global_ydl_opts['format_dropdown'] = selected_label
@@ -474,26 +596,14 @@ class DownloaderApp:
             self.global_ydl_opts['writeautomaticsub'] = False
             self.global_ydl_opts['embedsubtitles'] = False
 
-        # --- 2. Update Postprocessors ---    
-        def update_postprocessor(postprocessors, new_pp):
-            """ Replace or add a postprocessor dict with the same 'key'. """
-            for i, pp in enumerate(postprocessors):
-                if pp.get("key") == new_pp.get("key"):
-                    postprocessors[i] = new_pp  # Replace
-                    return
-            postprocessors.append(new_pp)  # Add if not found
+        # --- 2. Update Postprocessors ---
+        # Assigning into pp_map replaces a postprocessor in place or appends a new one
 
         # FFmpegMetadata (Metadata + Chapters)
         if add_metadata:
-            meta_pp = {"key": "FFmpegMetadata"}
-            meta_pp["add_metadata"] = True
-            meta_pp["add_chapters"] = True
-            update_postprocessor(postprocessors, meta_pp)
+            pp_map["FFmpegMetadata"] = dict(self.pp_templates["FFmpegMetadata"])
         else:
-            for i, pp in enumerate(postprocessors):
-                if pp.get("key") == "FFmpegMetadata":
-                    postprocessors.pop(i)
-                    break
+            pp_map.pop("FFmpegMetadata", None)
         if selected_ext:
             # FFmpegExtractAudio (Audio Extraction)
             if selected_ext in self.audio_exts:
@@ -503,127 +613,80 @@ class DownloaderApp:
                     quality = "0"
                 elif "smallest" in value:
                     quality = "9"
-                update_postprocessor(postprocessors, {
+                pp_map["FFmpegExtractAudio"] = {
                     "key": "FFmpegExtractAudio",
                     "preferredcodec": selected_ext,
                     "preferredquality": quality
-                })
+                }
                 # Remove FFmpegVideoConvertor if it exists it saves the time of conversion
-                for i, pp in enumerate(postprocessors):
-                    if pp.get("key") == "FFmpegVideoConvertor":
-                        postprocessors.pop(i)
-                        break
+                pp_map.pop("FFmpegVideoConvertor", None)
             # FFmpegVideoConvertor (Video Conversion) in desired format
             elif selected_ext in self.video_exts:
-                update_postprocessor(postprocessors, {
+                pp_map["FFmpegVideoConvertor"] = {
                     "key": "FFmpegVideoConvertor",
                     "preferedformat": selected_ext
-                })
+                }
             else:
                 # If the selected extension is not in audio or video, remove any existing FFmpegExtractAudio and FFmpegVideoConvertor postprocessor
-                for i, pp in enumerate(postprocessors):
-                    if pp.get("key") == "FFmpegExtractAudio":
-                        postprocessors.pop(i)
-                        break
-                    if pp.get("key") == "FFmpegVideoConvertor":
-                        postprocessors.pop(i)
-                        break
+                pp_map.pop("FFmpegExtractAudio", None)
+                pp_map.pop("FFmpegVideoConvertor", None)
         # EmbedThumbnail in last to avoid conflicts with other postprocessors
         if embed_thumbnail:
-            update_postprocessor(postprocessors,{"key": "EmbedThumbnail"})
+            pp_map["EmbedThumbnail"] = dict(self.pp_templates["EmbedThumbnail"])
         else:
-            for i, pp in enumerate(postprocessors):
-                if pp.get("key") == "EmbedThumbnail":
-                    postprocessors.pop(i)
-                    break
+            pp_map.pop("EmbedThumbnail", None)
         # EmbedSubtitles in last to avoid conflicts with other postprocessors
         if embed_subtitles:
-            update_postprocessor(postprocessors,{'key': 'FFmpegEmbedSubtitle'})
+            pp_map["FFmpegEmbedSubtitle"] = dict(self.pp_templates["FFmpegEmbedSubtitle"])
         else:
-            for i, pp in enumerate(postprocessors):
-                if pp.get("key") == "FFmpegEmbedSubtitle":
-                    postprocessors.pop(i)
-                    break
+            pp_map.pop("FFmpegEmbedSubtitle", None)
 
         # Sponsorblock
         if sponserblock == "mark":
-            self.global_ydl_opts['sponsorblock_mark'] = self.categories
+            self.global_ydl_opts['sponsorblock_mark'] = list(self.categories)  # Own copy, never an alias of self.categories
             self.global_ydl_opts['sponsorblock_remove'] = []
             self.global_ydl_opts['add_chapters'] = True
-            update_postprocessor(postprocessors, {
-            "key": "SponsorBlock",
-            "categories": self.categories,
-            "when": 'after_filter',
-            })
-            update_postprocessor(postprocessors, {
+            pp_map["SponsorBlock"] = {**self.pp_templates["SponsorBlock"], "categories": list(self.categories)}
+            pp_map["ModifyChapters"] = {
             "key": "ModifyChapters",
-            "sponsorblock_chapter_title": self.global_ydl_opts.get('sponsorblock_chapter_title','[SponsorBlock]: %(category_names)l')
-            })
-            update_postprocessor(postprocessors, {
-            "key": "FFmpegMetadata",
-            "add_metadata": add_metadata,
-            "add_chapters": True,
-            })
+            "sponsorblock_chapter_title": self.global_ydl_opts.get('sponsorblock_chapter_title', settingsWindow.SB_CHAPTER_TITLE)
+            }
+            pp_map["FFmpegMetadata"] = {**self.pp_templates["FFmpegMetadata"], "add_metadata": add_metadata}
 
         elif sponserblock == "remove":
-            self.global_ydl_opts['sponsorblock_remove'] = self.categories
+            self.global_ydl_opts['sponsorblock_remove'] = list(self.categories)
             self.global_ydl_opts['add_chapters'] = True
             if self.global_ydl_opts.get('sponsorblock_mark', None):
                 self.global_ydl_opts['sponsorblock_mark'] = []
 
-            update_postprocessor(postprocessors, {
-            "key": "SponsorBlock",
-            "categories": self.categories,
-            "when": 'after_filter',
-            })
-            update_postprocessor(postprocessors, {
+            pp_map["SponsorBlock"] = {**self.pp_templates["SponsorBlock"], "categories": list(self.categories)}
+            pp_map["ModifyChapters"] = {
             "key": "ModifyChapters",
             'remove_chapters_patterns': [],
             'remove_ranges': [],
-            "sponsorblock_chapter_title": '[SponsorBlock]: %(category_names)l',
-            'remove_sponsor_segments': self.categories
-            })
-            update_postprocessor(postprocessors, {
-            "key": "FFmpegMetadata",
-            "add_metadata": add_metadata,
-            "add_chapters": True,
-            })
+            "sponsorblock_chapter_title": settingsWindow.SB_CHAPTER_TITLE,
+            'remove_sponsor_segments': list(self.categories)
+            }
+            pp_map["FFmpegMetadata"] = {**self.pp_templates["FFmpegMetadata"], "add_metadata": add_metadata}
         elif sponserblock == "Other":
-            if self.global_ydl_opts.get('sponsorblock_mark', None) == self.categories:
+            modify_chapters = pp_map.get("ModifyChapters", {})
+            if frozenset(self.global_ydl_opts.get('sponsorblock_mark') or ()) == self.categories_set:
                 self.global_ydl_opts['sponsorblock_mark'] = []
                 # remove also from postprocessors.
-                for i, pp in enumerate(postprocessors):
-                    if pp.get("key") == "SponsorBlock":
-                        postprocessors.pop(i)
-                        break
-                    if pp.get("key") == "ModifyChapters":
-                            if "sponsorblock_chapter_title" in pp:
-                                pp.pop("sponsorblock_chapter_title")
-                                break
-            if self.global_ydl_opts.get('sponsorblock_remove', None) == self.categories:
+                pp_map.pop("SponsorBlock", None)
+                modify_chapters.pop("sponsorblock_chapter_title", None)
+            if frozenset(self.global_ydl_opts.get('sponsorblock_remove') or ()) == self.categories_set:
                 self.global_ydl_opts['sponsorblock_remove'] = []
                 # remove also from postprocessors.
-                for i, pp in enumerate(postprocessors):
-                    if pp.get("key") == "SponsorBlock":
-                        postprocessors.pop(i)
-                        break
-                    if pp.get("key") == "ModifyChapters":
-                        if "remove_ranges" in pp:
-                            pp.pop("remove_ranges")
-
-                        if "remove_chapters_patterns" in pp:
-                            pp.pop("remove_chapters_patterns")
-
-                        if "sponsorblock_chapter_title" in pp:
-                                pp.pop("sponsorblock_chapter_title")
-
-                        if "remove_sponsor_segments" in pp:
-                           pp.pop("remove_sponsor_segments")
-                           break
-
-        # Attach postprocessors if any exist
-        if postprocessors:
-            self.global_ydl_opts['postprocessors'] = postprocessors
+                pp_map.pop("SponsorBlock", None)
+                for option in ("remove_ranges", "remove_chapters_patterns", "sponsorblock_chapter_title", "remove_sponsor_segments"):
+                    modify_chapters.pop(option, None)
+
+        # Attach postprocessors if any exist (or replace an existing list that is now empty)
+        if pp_map or 'postprocessors' in self.global_ydl_opts:
+            self.global_ydl_opts['postprocessors'] = list(pp_map.values())
+        self.global_options_changed()
+        self.last_handy_state = state
         self.mark_as_unsaved_if_modified()  # Mark as unsaved if modified
     # A function to laad widgets value from global_ydl_opts to handy widgets
     def load_handy_settings(self):
@@ -642,9 +705,9 @@ class DownloaderApp:
             # Sponserblock
             sb_mark = self.global_ydl_opts.get('sponsorblock_mark', None)
             sb_remove = self.global_ydl_opts.get('sponsorblock_remove', None)
-            if sb_mark == self.categories:
+            if frozenset(sb_mark or ()) == self.categories_set:
                 self.sponserblock_var.set("mark")
-            elif sb_remove == self.categories:
+            elif frozenset(sb_remove or ()) == self.categories_set:
                 self.sponserblock_var.set("remove")
             else:
                 self.sponserblock_var.set("Other")
@@ -658,14 +721,30 @@ class DownloaderApp:
             self.log(f"Error loading settings: {e}", level="error")
         finally:
             self.is_loading = False 
+    def refresh_preset_dropdown(self):
+        """Rescan the preset folder and list its presets in the preset dropdown."""
+        self.preset_dropdown["values"] = (*settingsWindow.list_preset_names(self.preset_dir), "New/Unsaved")
+
+    def preset_path(self, name):
+        return os.path.join(self.preset_dir, f"{name}.json")
+
+    def load_preset(self, name):
+        """Return the parsed preset from the cache shared with the settings window. Do not mutate the result."""
+        return settingsWindow.load_preset_file(self.preset_path(name))
+
+    def preset_digest(self, name):
+        """Return settingsWindow.options_digest() of the preset file, cached alongside its parsed options."""
+        return settingsWindow.preset_file_digest(self.preset_path(name))
+
     def mark_as_unsaved_if_modified(self):
         current_name = self.preset_var.get()
         if current_name in ["New/Unsaved", ""]:
             return  # Already unsaved
         try:
-            with open(os.path.join(self.preset_dir, f"{current_name}.json")) as f:
-                saved_opts = json.load(f)
-            if saved_opts != self.global_ydl_opts:
+            # Compare digests, each side is only hashed again after it changed
+            if self.global_opts_digest is None:
+                self.global_opts_digest = settingsWindow.options_digest(self.global_ydl_opts)
+            if self.preset_digest(current_name) != self.global_opts_digest:
                 self.preset_var.set("New/Unsaved")
         except:
             self.preset_var.set("New/Unsaved")
@@ -674,18 +753,36 @@ class DownloaderApp:
         name = self.preset_var.get()
         if name == "New/Unsaved":
             return
-        path = os.path.join(self.preset_dir, f"{name}.json")
+        # Scan and parse on the I/O thread so a slow disk never freezes the window, apply on the Tk thread
+        future = self.io_pool.submit(self.read_preset, name)
+        future.add_done_callback(lambda future: self.preset_read_done(name, future))
+
+    def preset_read_done(self, name, future):
+        """Done callback of read_preset: hand the result to the Tk thread, unless the app is closing."""
+        if future.cancelled() or self.shutdown_event.is_set():
+            return  # Cancelled by shutdown(), the window is going away
+        self.master.after(0, self.apply_loaded_preset, name, future)
+
+    def read_preset(self, name):
+        """Return the parsed preset (runs on the I/O thread)."""
+        return self.load_preset(name)
+
+    def apply_loaded_preset(self, name, future):
+        """Make a preset read by read_preset() the global options."""
+        if self.shutdown_event.is_set():
+            return
         try:
-            with open(path, "r") as f:
-                self.is_loading = True
-                self.ydl_opts = json.load(f)
-                self.global_ydl_opts = self.ydl_opts.copy()  # Update global options
-                self.load_handy_settings()
-            self.log(f"✅ Loaded preset: {name}")
+            opts = future.result()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load preset: {e}")
-        finally:
-            self.is_loading = False
+            return
+        if self.preset_var.get() != name:
+            return  # Another preset was picked while this one was loading
+        self.ydl_opts = opts
+        self.global_ydl_opts = copy.deepcopy(opts)  # Update global options, the cached preset stays untouched
+        self.global_options_changed()
+        self.load_handy_settings()
+        self.log(f"✅ Loaded preset: {name}")
 
     def open_settings_window(self,initial_opts=None,global_change=True):
         if initial_opts is None:
@@ -693,7 +790,9 @@ class DownloaderApp:
         settings = settingsWindow.show_settings_window(self.master, initial_opts=initial_opts, global_change=global_change)
         if settings != initial_opts and global_change:
             self.global_ydl_opts = settings
+            self.global_options_changed()
             self.load_handy_settings()
+            self.mark_as_unsaved_if_modified()  # The dropdown must not keep naming a preset these options no longer match
             self.log("🔧 Settings Updated and saved to default template.")
         elif global_change and settings == initial_opts:
             self.log("⚠️ No settings were changed.")
@@ -706,8 +805,9 @@ class DownloaderApp:
             if len(selected_items) > 1:
                 new_ydl_opts = self.open_settings_window(initial_opts=self.global_ydl_opts, global_change=False)  # Open settings window
                 for item in selected_items:
-                    index = int(self.queue_table.item(item, "values")[0]) - 1
-                    task = self.queue[index]
+                    task = self.task_by_iid.get(item)
+                    if task is None:
+                        continue
                     if task["status"] == "Downloading":
                         self.log(f"⚠️ Cannot modify settings for downloading item: {task['query']}", level="warning")
                         continue
@@ -721,14 +821,14 @@ class DownloaderApp:
                     else:
                         self.log(f"⚠️ Cannot modify settings for item: {task['query']}", level="warning")
             if len(selected_items) == 1:
-                item = selected_items[0]
-                index = int(self.queue_table.item(item, "values")[0]) - 1
-                task = self.queue[index]
+                task = self.task_by_iid.get(selected_items[0])
+                if task is None:
+                    return
                 if task["status"] == "Downloading":
                     self.log(f"⚠️ Cannot modify settings for downloading item: {task['query']}", level="warning")
                     return
                 if task["status"] == "Queued" or task["status"] == "Completed" or task["status"] == "Failed":
-                    new_ydl_opts = self.open_settings_window(initial_opts=task['ydl_opts'], global_change=False)
+                    new_ydl_opts = self.open_settings_window(initial_opts=dict(task['ydl_opts']), global_change=False)
                     if new_ydl_opts != task['ydl_opts']:
                         try:
                             task["ydl_opts"] = new_ydl_opts  # Update task-specific options
@@ -753,11 +853,11 @@ class DownloaderApp:
             self.last_selected_index = self.queue_table.index(last_clicked)
 
             first_index = self.queue_table.index(selected[0])  # First selected item
-            last_index = self.queue_table.index(last_clicked)  # Last clicked item
+            last_index = self.last_selected_index  # Last clicked item
 
-            # ✅ Select all items in range
-            for i in range(min(first_index, last_index), max(first_index, last_index) + 1):
-                self.queue_table.selection_add(self.queue_table.get_children()[i])  # ✅ Add to selection
+            # ✅ Select all items in range with a single selection_add call
+            low, high = sorted((first_index, last_index))
+            self.queue_table.selection_add(self.queue_table.get_children()[low:high + 1])
 
     def on_drag_select(self, event):
         """Allows Drag Selection in Treeview using Mouse Motion."""
@@ -800,16 +900,19 @@ class DownloaderApp:
 
                     # Check if we got a valid playlist response
                     if 'entries' in playlist_info:
-                        for video in playlist_info['entries']:
-                            if 'url' in video and 'title' in video:
-                                task = {
-                                    "query": video['url'],
-                                    "status": "Queued",
-                                    "ydl_opts": self.global_ydl_opts.copy(),  # Copy global options
-                                }
-                                self.queue.append(task)
-                                self.log(f"Added video to queue: {video['title']}")
-                        self.log(f"Added {len(playlist_info['entries'])} videos to the queue.")
+                        # Build every task first and log once, a log line per video floods the Text widget
+                        tasks = [
+                            {
+                                "query": video['url'],
+                                "uid": next(self.task_ids),
+                                "status": "Queued",
+                                "ydl_opts": self.new_task_opts(),
+                            }
+                            for video in playlist_info['entries']
+                            if 'url' in video and 'title' in video
+                        ]
+                        self.queue.extend(tasks)
+                        self.log(f"Added {len(tasks)} videos to the queue.")
                     else:
                         self.log("⚠️ No videos found in playlist!", level="warning")
                     self.update_queue_listbox_threadsafe()
@@ -817,11 +920,11 @@ class DownloaderApp:
                     self.log(f"❌ Error fetching playlist: {e}", level="error")
                     self.update_queue_listbox_threadsafe()
             # Start a new thread to fetch the playlist
-            threading.Thread(target=fetch_playlist, daemon=True).start()
+            self.start_worker(fetch_playlist)
     
         else:
             # Normal single video handling
-            task = {"query": query, "status": "Queued", "ydl_opts": self.global_ydl_opts.copy()}
+            task = {"query": query, "uid": next(self.task_ids), "status": "Queued", "ydl_opts": self.new_task_opts()}
             self.queue.append(task)
     
         self.update_queue_listbox_threadsafe()
@@ -834,29 +937,22 @@ class DownloaderApp:
         selected_items = self.queue_table.selection()  # Get selected items from Treeview
 
         if selected_items:
-            indices = []
+            drop = set()
             for item in selected_items:
-                try:
-                    if self.queue_table.item(item, "values")[1] == "Downloading":
-                        query = self.queue_table.item(item, "values")[3]
-                        self.log(f"⚠️ Cannot remove downloading item: {query}", level="warning")
-                        continue
-                    else:
-                    # Assume the first column holds the serial number
-                        index = int(self.queue_table.item(item, "values")[0]) - 1
-                        indices.append(index)
-                except Exception as e:
-                    self.log(f"Error retrieving index for item {item}: {e}", level="error")
-            # Remove duplicates and sort indices in descending order
-            indices = sorted(set(indices), reverse=True)
-            for index in indices:
-                del self.queue[index]
+                task = self.task_by_iid.get(item)
+                if task is None:
+                    self.log(f"Error retrieving task for item {item}", level="error")
+                elif task["status"] == "Downloading":
+                    self.log(f"⚠️ Cannot remove downloading item: {task['query']}", level="warning")
+                else:
+                    drop.add(id(task))
+            self.queue = deque(task for task in list(self.queue) if id(task) not in drop)
             self.update_queue_listbox_threadsafe()
-            self.log(f"✅ Removed {len(indices)} selected items from queue.")
+            self.log(f"✅ Removed {len(drop)} selected items from queue.")
         else:
             confirmation = messagebox.askyesno("Warning", "Do you want to clear the entire queue?")
             if confirmation:
-                active_downloads = any(task["status"] == "Downloading" for task in self.queue)
+                active_downloads = self.active_count > 0
                 if active_downloads:
                     ask = messagebox.askyesnocancel("Warning", "Some downloads are still running and you cannot cancel them!\n\n"
                     "press 'Yes' to keep the downloads running in background and clear them from the queue\n"
@@ -867,9 +963,7 @@ class DownloaderApp:
                         self.update_queue_listbox_threadsafe()
                         self.log("✅ Cleared the entire queue while dowloading items running in background.")
                     elif ask == False:
-                        for task in self.queue:
-                            if task["status"] != "Downloading":
-                                self.queue.remove(task)
+                        self.queue = deque(task for task in list(self.queue) if task["status"] == "Downloading")
                         self.update_queue_listbox_threadsafe()
                         self.log("✅ Cleared the entire queue except the Downloading items.")
                     elif ask == None:
@@ -883,81 +977,120 @@ class DownloaderApp:
     def load_spreadsheet_threaded(self):
         def load_spreadsheet_worker():
             file_path = filedialog.askopenfilename(filetypes=[
-                ("Spreadsheet Files", "*.csv *.xlsx *.xls"),
+                ("Spreadsheet Files", "*.csv *.xlsx"),
             ])
             if not file_path:
                 return
 
+            # Collect tasks locally and publish them in batches, one table refresh per batch
+            pending = []
+            def flush_pending():
+                self.queue.extend(pending)
+                pending.clear()
+                self.update_queue_listbox_threadsafe()
+
             try:
                 ext = os.path.splitext(file_path)[-1].lower()
 
                 valid_count = 0
                 if ext == ".csv":
-                    # Only parse comma-separated queries, use global_ydl_opts
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        raw_content = f.read()
-                    queries = [q.strip() for q in raw_content.split(",") if q.strip()]
-
-                    for query in queries:
-                        task = {
-                            "query": query,
-                            "status": "Queued",
-                            "ydl_opts": self.global_ydl_opts.copy()
-                        }
-                        self.queue.append(task)
-                        self.update_queue_listbox_threadsafe()
-                        valid_count += 1
-
-                elif ext in (".xlsx", ".xls"):
-                    # Structured rows: one query per row, optional preset
-                    df = pd.read_excel(file_path)
-                    df.columns = [col.strip().lower() for col in df.columns]
-
-                    for _, row in df.iterrows():
-                        query = row.get('query') or row.get('url')
-                        if isinstance(query, int) or isinstance(query, float):
-                            query = str(query)
-                        elif not isinstance(query, str) or not query.strip():
-                            continue
-
-                        query = query.strip()
-                        preset = str(row.get('preset')).strip() if row.get('preset') else ""
-
-                        # Load preset settings or fall back
-                        if preset and preset.lower() != "default":
-                            preset_path = os.path.join(self.preset_dir, f"{preset}.json")
-                            if os.path.exists(preset_path):
-                                with open(preset_path, "r") as f:
-                                    ydl_opts = json.load(f)
-                            else:
-                                preset = "New/Unsaved"
-                                ydl_opts = self.global_ydl_opts.copy()
+                    # Stream comma-separated queries row by row, use global_ydl_opts.
+                    # A header row naming a 'query' or 'url' column limits parsing to that column.
+                    with open(file_path, 'r', newline='', encoding='utf-8-sig') as f:
+                        reader = csv.reader(f)
+                        header = next(reader, [])
+                        names = [cell.strip().lower() for cell in header]
+                        column = None
+                        if "query" in names:
+                            column = names.index("query")
+                        elif "url" in names:
+                            column = names.index("url")
                         else:
-                            ydl_opts = self.global_ydl_opts.copy()
-
-                        task = {
-                            "query": query,
-                            "status": "Queued",
-                            "ydl_opts": ydl_opts
-                        }
-                        self.queue.append(task)
-                        self.log(f"Added {query} with preset {preset} to queue.")
-                        self.update_queue_listbox_threadsafe()
-                        valid_count += 1
+                            reader = itertools.chain([header], reader)
+
+                        for row in reader:
+                            if self.shutdown_event.is_set():
+                                break
+                            cells = row if column is None else row[column:column + 1]
+                            for query in cells:
+                                query = query.strip()
+                                if not query:
+                                    continue
+                                task = {
+                                    "query": query,
+                                    "uid": next(self.task_ids),
+                                    "status": "Queued",
+                                    "ydl_opts": self.new_task_opts()
+                                }
+                                pending.append(task)
+                                valid_count += 1
+                                if len(pending) >= QUEUE_REFRESH_BATCH:
+                                    flush_pending()
+
+                elif ext == ".xlsx":
+                    # Structured rows: one query per row, optional preset.
+                    # Read-only mode streams the rows instead of loading the whole sheet first
+                    workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+                    try:
+                        rows = workbook.active.iter_rows(values_only=True)
+                        names = ["" if name is None else str(name).strip().lower() for name in next(rows, ())]
+                        query_col, url_col, preset_col = (names.index(name) if name in names else None
+                                                          for name in ("query", "url", "preset"))
+                        def cell(row, col):
+                            if col is None or col >= len(row) or row[col] is None:
+                                return ""
+                            return str(row[col]).strip()
+                        preset_cache = {}  # preset name -> parsed options (None if missing), read once per import
+
+                        for row in rows:
+                            if self.shutdown_event.is_set():
+                                break
+                            query = cell(row, query_col) or cell(row, url_col)
+                            if not query:
+                                continue
+                            preset = cell(row, preset_col)
+
+                            # Load preset settings or fall back
+                            if preset and preset.lower() != "default":
+                                if preset not in preset_cache:
+                                    preset_path = self.preset_path(preset)
+                                    preset_cache[preset] = self.load_preset(preset) if os.path.exists(preset_path) else None
+                                if preset_cache[preset] is not None:
+                                    ydl_opts = ChainMap({}, preset_cache[preset])
+                                else:
+                                    preset = "New/Unsaved"
+                                    ydl_opts = self.new_task_opts()
+                            else:
+                                ydl_opts = self.new_task_opts()
+
+                            task = {
+                                "query": query,
+                                "uid": next(self.task_ids),
+                                "status": "Queued",
+                                "ydl_opts": ydl_opts
+                            }
+                            pending.append(task)
+                            valid_count += 1
+                            if len(pending) >= QUEUE_REFRESH_BATCH:
+                                flush_pending()
+                    finally:
+                        workbook.close()  # Read-only workbooks keep the file open (locked on Windows) until closed
 
                 else:
-                    messagebox.showerror("Unsupported Format", "Please select a CSV or Excel file.")
+                    messagebox.showerror("Unsupported Format", "Please select a CSV or Excel (.xlsx) file.")
                     return
 
+                flush_pending()
                 if valid_count == 0:
                     messagebox.showerror("No Valid Entries", "No valid queries or URLs found.")
                 else:
                     self.log(f"✅ Loaded {valid_count} entries from {os.path.basename(file_path)}.")
 
             except Exception as e:
+                flush_pending()  # Keep the rows that were read before the failure
                 messagebox.showerror("Error", f"Failed to process file:\n{e}")
 
-        threading.Thread(target=load_spreadsheet_worker, daemon=True).start()
+        self.start_worker(load_spreadsheet_worker)
 
 
     #export function to export log into file
@@ -966,9 +1099,10 @@ class DownloaderApp:
         if not file_path:
             return
         try:
+            self.flush_log()  # Include messages still waiting for the next batch
+            # The Text content already has its newlines, write it out in one go
             with open(file_path, 'w', encoding='utf-8') as f:
-                for line in self.log_text.get("1.0", tk.END).splitlines():
-                    f.write(line + "\n")
+                f.write(self.log_text.get("1.0", "end-1c"))
             self.log(f"✅ Log exported to {file_path}")
         except Exception as e:
             self.log(f"❌ Error exporting log: {e}", level="error")
@@ -987,127 +1121,216 @@ class DownloaderApp:
             tk.messagebox.showwarning("Warning", "The download queue is empty.")
             return
 
-        # Put tasks in the download queue
-        for task in self.queue:
-            if task["status"] == "Queued":
-                self.download_queue.put(task)
-
-        # Start only 4 worker threads
-        for _ in range(self.max_threads):
-            t = threading.Thread(target=self.worker, daemon=True)
-            t.start()
-    def worker(self):
-        """Worker thread to process downloads from the queue"""
-        while not self.download_queue.empty():
-            task = self.download_queue.get()  # Get next task
-            self.download_task(task)  # Run the download
-            self.download_queue.task_done()  # Mark as completed
+        # Forget finished futures, then hand every queued task not already waiting in the pool to it
+        self.futures = [future for future in self.futures if not future.done()]
+        for task in list(self.queue):
+            if task["status"] == "Queued" and id(task) not in self.submitted:
+                self.submitted.add(id(task))
+                self.futures.append(self.pool.submit(self.download_task, task))
+
+    def start_worker(self, target, daemon=True):
+        """Run target on a tracked background thread that leaves self.workers when it finishes."""
+        def run():
+            try:
+                target()
+            finally:
+                self.workers.discard(thread)
+        thread = threading.Thread(target=run, daemon=daemon)
+        self.workers.add(thread)
+        thread.start()
+        return thread
+
+    def join_workers(self, timeout=WORKER_JOIN_TIMEOUT):
+        """Wait for the tracked background threads and running downloads, sharing one deadline between them.
+
+        Called once mainloop has returned, so the window is already gone while it waits.
+        Returns False if a download is still running after the deadline (e.g. in a long ffmpeg merge),
+        the pool's non-daemon threads would then keep the process alive until it ends.
+        """
+        deadline = time.monotonic() + timeout
+        current = threading.current_thread()  # Never join the calling thread, whichever it is
+        # Every thread keeps running while another is joined, so the waits overlap and the total stays within timeout
+        for thread in list(self.workers):
+            if thread is not current:
+                thread.join(max(0.0, deadline - time.monotonic()))
+        # Downloads still in the pool get whatever is left, all waited on at once
+        _, running = wait(self.futures, timeout=max(0.0, deadline - time.monotonic()))
+        return not running
+
+    def shutdown(self):
+        """Stop the download pool, dropping tasks that have not started yet.
+
+        Running downloads are aborted by their next progress report (see abort_if_closing).
+        Safe to call again, later calls do nothing.
+        """
+        if self.shutdown_event.is_set():
+            return
+        self.shutdown_event.set()
+        if self.tray_icon is not None:
+            self.tray_icon.stop()  # The only stop, lets the non-daemon tray thread return
+        self.pool.shutdown(wait=False, cancel_futures=True)
+        self.io_pool.shutdown(wait=False, cancel_futures=True)
+        # Close the idle instances now, release_ydl closes the busy ones when their download stops
+        with self.ydl_lock:
+            for ydl in self.ydl_instances:
+                if ydl not in self.ydl_busy:
+                    ydl.close()
+            self.ydl_instances = list(self.ydl_busy)
+
+    def abort_if_closing(self, d=None):
+        """yt-dlp hook: stop the running download or postprocessor once shutdown() was called."""
+        if self.shutdown_event.is_set():
+            raise youtube_dl.utils.DownloadCancelled("Application is closing")
+
+    def release_ydl(self, ydl):
+        """Mark a YoutubeDL from get_ydl() as idle again, closing it if shutdown() ran meanwhile."""
+        with self.ydl_lock:
+            self.ydl_busy.discard(ydl)
+            if self.shutdown_event.is_set() and ydl in self.ydl_instances:
+                self.ydl_instances.remove(ydl)
+                ydl.close()
+
+    def get_ydl(self, ydl_opts, task):
+        """Return the calling thread's YoutubeDL for these options, creating it on first use, bound to task."""
+        cache = getattr(self.thread_state, "ydl_cache", None)
+        if cache is None:
+            cache = self.thread_state.ydl_cache = {}
+        key = settingsWindow.options_digest(ydl_opts)
+        # Under the lock so shutdown() never closes or forgets an instance while it is evicted or handed out
+        with self.ydl_lock:
+            self.abort_if_closing()  # After shutdown() the cached instances may already be closed
+            ydl = cache.get(key)
+            if ydl is None:
+                if len(cache) >= 8:  # Keep a handful of option sets per thread, drop the oldest
+                    old = cache.pop(next(iter(cache)))
+                    self.ydl_instances.remove(old)
+                    self.ydl_tasks.pop(old, None)
+                    old.close()
+                ydl = youtube_dl.YoutubeDL({
+                    **ydl_opts,
+                    # One hook for the instance's lifetime, looking up the task it downloads now.
+                    # yt-dlp may call it from its fragment threads, so no thread-local state here
+                    'progress_hooks': [lambda d: self.progress_hook(d, self.ydl_tasks[ydl])],
+                    'postprocessor_hooks': [self.abort_if_closing],
+                    'logger': self,
+                })
+                cache[key] = ydl
+                self.ydl_instances.append(ydl)
+            self.ydl_tasks[ydl] = task
+            self.ydl_busy.add(ydl)  # Busy until release_ydl, shutdown() leaves it open
+        return ydl
 
     def download_task(self, task):
         """Download video/audio with metadata and proper error handling."""
 
-        task["status"] = "Downloading"
-        task["progress"] = "0% | --:--"
-        self.update_queue_listbox_threadsafe()
-        self.log(f"🔄 Starting download: {task['query']}")
+        with self.active_lock:
+            self.active_count += 1
+        try:
+            task["status"] = "Downloading"
+            task["progress"] = "0% | --:--"
+            self.submitted.discard(id(task))  # The status now keeps it from being submitted again
+            self.update_queue_listbox_threadsafe()
+            self.log(f"🔄 Starting download: {task['query']}")
 
-        query = task["query"]
+            query = task["query"]
 
-        # If the query is a search term, prepend ytsearch:
-        if not (query.startswith("http://") or query.startswith("https://")):
-            query = f"ytsearch:{query}"
-        ydl_opts = task['ydl_opts']  # Use task-specific options
-
-        #setting directory
-        try:
-            custom_path=task["ydl_opts"]['custom_file_path']
-            if custom_path:
-                ydl_opts['outtmpl'] = os.path.join(custom_path, '%(title)s.%(ext)s')
-        except KeyError:
-            ydl_opts['outtmpl'] = os.path.join(self.download_directory, '%(title)s.%(ext)s')
-        except Exception as e:
-            self.log(f"Setting default directroy to task {task} because of {e}", level="error")
-            ydl_opts['outtmpl'] = os.path.join(self.download_directory, '%(title)s.%(ext)s')
-        # #add download specific values
-        ydl_opts.update({
-            'progress_hooks': [lambda d: self.progress_hook(d, task)],
-            'logger': self,
-            'noplaylist': True  # Ensures only a single video is downloaded, not a playlist
-            })
-        #check if current ydl_opts has final_ext = orignial if yes then remove it from ydl_opts
-        if ydl_opts.get('final_ext') == "original":
-            ydl_opts.pop('final_ext')
-        #managing commnets extraction : 
-        if task["ydl_opts"].get('extract_comments', False):
-            ydl_opts['extract_comments'] = True
-            ydl_opts['writeinfojson'] = True        
-        try:
-            with youtube_dl.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([query])
-            task["status"] = "Completed"
-            task["progress"] = "100% | Done"            
-        except Exception as e:
-            task["status"] = f"Failed"
-            task["progress"] = f"❌ Error"
-            self.log(f"❌ Error downloading {query}: {e}", level="error")
+            # If the query is a search term, prepend ytsearch:
+            if not query.startswith(("http://", "https://")):
+                query = f"ytsearch:{query}"
+            ydl_opts = dict(task['ydl_opts'])  # Use a copy of the task-specific options
 
+            #setting directory
+            try:
+                custom_path=task["ydl_opts"]['custom_file_path']
+                if custom_path:
+                    ydl_opts['outtmpl'] = os.path.join(custom_path, '%(title)s.%(ext)s')
+            except KeyError:
+                ydl_opts['outtmpl'] = os.path.join(self.download_directory, '%(title)s.%(ext)s')
+            except Exception as e:
+                self.log(f"Setting default directroy to task {task} because of {e}", level="error")
+                ydl_opts['outtmpl'] = os.path.join(self.download_directory, '%(title)s.%(ext)s')
+            # #add download specific values
+            ydl_opts['noplaylist'] = True  # Ensures only a single video is downloaded, not a playlist
+            #check if current ydl_opts has final_ext = orignial if yes then remove it from ydl_opts
+            if ydl_opts.get('final_ext') == "original":
+                ydl_opts.pop('final_ext')
+            #managing commnets extraction : 
+            if task["ydl_opts"].get('extract_comments', False):
+                ydl_opts['extract_comments'] = True
+                ydl_opts['writeinfojson'] = True        
+            try:
+                # Reuse this thread's YoutubeDL when an earlier task had identical options
+                self.last_refresh[id(task)] = 0.0
+                ydl = self.get_ydl(ydl_opts, task)
+                try:
+                    ydl.download([query])
+                finally:
+                    self.release_ydl(ydl)
+                task["status"] = "Completed"
+                task["progress"] = "100% | Done"            
+            except Exception as e:
+                task["status"] = f"Failed"
+                task["progress"] = f"❌ Error"
+                self.log(f"❌ Error downloading {query}: {e}", level="error")
+        finally:
+            self.last_refresh.pop(id(task), None)
+            with self.active_lock:
+                self.active_count -= 1
 
         self.update_queue_listbox_threadsafe()
     def extract_comments_postprocessor(self, d):
         """Post-process comments extraction, including replies."""
-        def extract_comments():
+        def extract_comments(info_json_path, comments_file_path):
             if d['status'] == 'finished' and d.get('filename'):
-                    with open(info_json_path, 'r', encoding='utf-8') as f:
-                        info = json.load(f)
+                    info = settingsWindow.load_json_file(info_json_path)
                     comments = info.get('comments', [])
                     if comments:
-                        # Extract Comments and Replies
-                        formatted_comments = []
-                        for idx, comment in enumerate(comments, start=1):
-                            text = comment.get('text', 'No text available')
-                            author = comment.get('author', 'Unknown Author')
-                            timestamp = comment.get('timestamp', 'Unknown Timestamp')
-                            formatted_comments.append(f"{idx}. [{timestamp}] {author}: {text}")
-
-                            # Handle replies if available
-                            replies = comment.get('replies', [])
-                            for reply_idx, reply in enumerate(replies, start=1):
-                                reply_text = reply.get('text', 'No text available')
-                                reply_author = reply.get('author', 'Unknown Author')
-                                reply_timestamp = reply.get('timestamp', 'Unknown Timestamp')
-                                formatted_comments.append(
-                                    f"    ↳ {idx}.{reply_idx} [{reply_timestamp}] {reply_author}: {reply_text}"
-                                )
-
-                        # Save comments and replies to a file or process them as needed
-                        comments_file_path = os.path.splitext(d['filename'])[0] + "_comments.txt"
-                        with open(comments_file_path, 'w', encoding='utf-8') as cf:
-                            for formatted_comment in formatted_comments:
-                                cf.write(formatted_comment + "\n")
+                        # Stream comments and replies straight into a large write buffer
+                        # instead of holding every formatted line in memory first
+                        with open(comments_file_path, 'w', encoding='utf-8', buffering=1 << 19) as cf:
+                            for idx, comment in enumerate(comments, start=1):
+                                text = comment.get('text', 'No text available')
+                                author = comment.get('author', 'Unknown Author')
+                                timestamp = comment.get('timestamp', 'Unknown Timestamp')
+                                cf.write(f"{idx}. [{timestamp}] {author}: {text}\n")
+
+                                # Handle replies if available
+                                replies = comment.get('replies', [])
+                                for reply_idx, reply in enumerate(replies, start=1):
+                                    reply_text = reply.get('text', 'No text available')
+                                    reply_author = reply.get('author', 'Unknown Author')
+                                    reply_timestamp = reply.get('timestamp', 'Unknown Timestamp')
+                                    cf.write(f"    ↳ {idx}.{reply_idx} [{reply_timestamp}] {reply_author}: {reply_text}\n")
                         self.log(f"✅ Extracted {len(comments)} comments (including replies) to {comments_file_path}")            # Extract comments from the info.json file
                     else:
                         self.log("⚠️ No comments found in the video.", level="warning")
-        info_json_path = os.path.splitext(d['filename'])[0] + ".info.json"
+        base = os.path.splitext(d['filename'])[0]
+        comments_file_path = base + "_comments.txt"
         # handling .f in filename to get the correct path of info.json file
-        if ".f" in d['filename']:
-            info_json_path = os.path.splitext(d['filename'])[0] + "info.json"
+        info_json_path = base + ("info.json" if ".f" in d['filename'] else ".info.json")
         if os.path.exists(info_json_path):
-            extract_comments()
+            extract_comments(info_json_path, comments_file_path)
         else:
             #ask filepath manually if info.json file is not found
-            info_json_path = filedialog.askopenfilename(title=f"info.json for {d.get('filename',"latest")}", filetypes=[("JSON Files", "*.json")])
+            info_json_path = filedialog.askopenfilename(title=f"info.json for {d.get('filename', 'latest')}", filetypes=[("JSON Files", "*.json")])
             if info_json_path:
-                extract_comments()
+                extract_comments(info_json_path, comments_file_path)
             else:
                 self.log("❌ info.json file not found for comments Extraction.", level="error")
 
     def progress_hook(self, d, task):
         """Update progress percentage & ETA in Treeview."""
+        self.abort_if_closing()  # The only way to stop a running download, yt-dlp has no cancel call
         if d['status'] == 'downloading':
             percent = d.get('_percent_str', '0%').strip()
             eta = d.get('_eta_str', '--:--')
             # Update task progress
             task["progress"] = f"{percent} | {eta}"
+            #yt-dlp calls this for every chunk, only refresh the table a few times per second
+            now = time.monotonic()
+            if now - self.last_refresh.get(id(task), 0.0) < PROGRESS_REFRESH_INTERVAL:
+                return
+            self.last_refresh[id(task)] = now
             self.update_queue_listbox_threadsafe()
         elif d['status'] == 'finished':
             # Call the comments extraction postprocessor if enabled
@@ -1117,54 +1340,59 @@ class DownloaderApp:
             task["progress"] = "100% | Done"
             self.update_queue_listbox_threadsafe()
     def update_queue_listbox_threadsafe(self):
-        def update_queue_listbox():
-            existing_iids = set(self.queue_table.get_children())
-            expected_iids = set()
-    
-            for i, task in enumerate(self.queue):
-                iid = f"item_{i}"
-                expected_iids.add(iid)
-    
-                status = task["status"]
-                progress = task.get("progress", "0% | --:--")
-                values = (i + 1, status, task["query"], progress)
-    
-                # Determine color tag
-                color = "gray"
-                if status == "Downloading":
-                    color = "blue"
-                elif status == "Completed":
-                    color = "green"
-                elif status.startswith("Failed"):
-                    color = "red"
-    
-                if self.queue_table.exists(iid):
-                    old_values = self.queue_table.item(iid, "values")
-                    if old_values != values:
-                        self.queue_table.item(iid, values=values, tags=(color,))
-                else:
-                    self.queue_table.insert("", "end", iid=iid, values=values, tags=(color,))
-    
-            # Remove orphaned rows
-            for iid in existing_iids - expected_iids:
-                self.queue_table.delete(iid)
-    
-            # Apply tag styles (once)
-            self.queue_table.tag_configure("gray", foreground="gray")
-            self.queue_table.tag_configure("blue", foreground="blue")
-            self.queue_table.tag_configure("green", foreground="green")
-            self.queue_table.tag_configure("red", foreground="red")
-    
-        self.master.after(10, update_queue_listbox)
+        """Schedule a queue table refresh; requests made before it runs share that one refresh."""
+        if self.queue_refresh_pending:
+            return
+        self.queue_refresh_pending = True
+        # A short delay (not just idle) so several download threads reporting at once share one refresh
+        self.master.after(QUEUE_REFRESH_DELAY_MS, self.update_queue_listbox)
+
+    def update_queue_listbox(self):
+        """Sync the queue table with self.queue (Tk thread only)."""
+        self.queue_refresh_pending = False
+        # Diff against what was last rendered, kept in Python, so unchanged rows cost no Tcl calls at all
+        existing = self.rendered_rows
+        rendered_rows = {}
+        task_by_iid = {}
+
+        # Rows are keyed by the task's uid, not position, so deletions never shift them.
+        # Unlike id(), a uid is never reused by a later task
+        for i, task in enumerate(list(self.queue)):
+            iid = f"item_{task['uid']}"
+            task_by_iid[iid] = task
+
+            status = task["status"]
+            progress = task.get("progress", "0% | --:--")
+            values = (str(i + 1), status, str(task["query"]), progress)
+            rendered_rows[iid] = values
+            old_values = existing.get(iid)
+            if old_values == values:
+                continue  # Row already shows this task as-is
+
+            # Determine color tag, any other "Failed..." status is red
+            color = STATUS_COLORS.get(status) or ("red" if status.startswith("Failed") else "gray")
+            if old_values is None:
+                self.queue_table.insert("", "end", iid=iid, values=values, tags=(color,))
+            else:
+                self.queue_table.item(iid, values=values, tags=(color,))
+
+        # Remove orphaned rows
+        for iid in existing.keys() - task_by_iid.keys():
+            self.queue_table.delete(iid)
+        self.task_by_iid = task_by_iid
+        self.rendered_rows = rendered_rows
+
     #function to load queue values and tasks from a json file
     def import_queue(self):
         file_path = filedialog.askopenfilename(title="Select Queue File", filetypes=[("JSON Files", "*.json")])
         if not file_path:
             return
         try:
-            with open(file_path, "r") as f:
-                self.queue = json.load(f)
-                self.update_queue_listbox_threadsafe()
+            tasks = settingsWindow.load_json_file(file_path)
+            for task in tasks:
+                task["uid"] = next(self.task_ids)  # uids belong to this session and are never written to the file
+            self.queue = deque(tasks)
+            self.update_queue_listbox_threadsafe()
             self.log(f"✅ Loaded queue from {file_path}")
         except Exception as e:
             self.log(f"❌ Error loading queue: {e}", level="error")
@@ -1173,10 +1401,15 @@ class DownloaderApp:
         file_path = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON Files", "*.json")])
         if not file_path:
             return
+        # Snapshot the queued tasks here, encoding and writing happen on a worker so a long queue never blocks the UI.
+        # Non-daemon and tracked, so closing the app waits for the file to be complete
+        tasks = [{key: value for key, value in task.items() if key != "uid"} for task in list(self.queue) if task["status"] == "Queued"]
+        self.start_worker(lambda: self.write_queue_file(file_path, tasks), daemon=False)
+
+    def write_queue_file(self, file_path, tasks):
+        """Write exported tasks to a JSON file (worker thread)."""
         try:
-            with open(file_path, "w") as f:
-                self.queue = [task for task in self.queue if task["status"] == "Queued"]
-                json.dump(self.queue, f, indent=4)
+            settingsWindow.dump_json_file(file_path, tasks)
             self.log(f"✅ Exported queue to {file_path}")
         except Exception as e:
             self.log(f"❌ Error exporting queue: {e}", level="error")
@@ -1184,14 +1417,31 @@ class DownloaderApp:
     #function to log messages into the log window
     def log(self, message, level="info"):
         """Improved Logging with Colors"""
-        colors = {"info": "white", "success": "lightgreen", "warning": "orange", "error": "red"}
-        
-        self.log_text.insert(tk.END, message + "\n", level)
-        self.log_text.tag_config(level, foreground=colors.get(level, "white"))
-        if self.master.focus_get() == self.log_text:
-            pass  # Don't auto-scroll if the log window is focused
-        else:
-            self.log_text.see(tk.END)  # Auto-scroll to the end
+        #messages are batched and written by flush_log every 50 ms, callable from any thread
+        self.log_messages.put((message, level))
+        if not self.log_flush_pending and not self.shutdown_event.is_set():  # No flush once the window is going away
+            self.log_flush_pending = True
+            self.master.after(50, self.flush_log)
+
+    def flush_log(self):
+        """Write every pending log message with one insert, trim and auto-scroll (Tk thread)."""
+        self.log_flush_pending = False
+        batch = []
+        while True:
+            try:
+                message, level = self.log_messages.get_nowait()
+            except queue.Empty:
+                break
+            batch += (message + "\n", level)
+        if not batch:
+            return
+        # Text.insert takes alternating text/tag arguments, so the whole batch is a single Tk call
+        self.log_text.insert(tk.END, *batch)
+        #bound the log, a huge Text widget makes every insert and search slower
+        if int(self.log_text.index("end-1c").split(".")[0]) > MAX_LOG_LINES + LOG_TRIM_SLACK:
+            self.log_text.delete("1.0", f"end-{MAX_LOG_LINES}l linestart")
+        if self.master.focus_get() != self.log_text:
+            self.log_text.see(tk.END)  # Auto-scroll unless the user is reading the log
     #Functions required for youtube_dl logger
     def debug(self, msg): self.log("[DEBUG] " + msg, "info") 
     def success(self, msg): self.log("[SUCCESS] " + msg, "success") 
@@ -1201,9 +1451,12 @@ class DownloaderApp:
 
     def close_application(self):
         """Gracefully closes the application, ensuring no active downloads are interrupted."""
+        if self.closing:
+            return  # Already closing, e.g. the window X and the tray Exit were both used
+        self.closing = True
 
         # ✅ Step 1: Check if any downloads are in progress
-        active_downloads = any(task["status"] == "Downloading" for task in self.queue)
+        active_downloads = self.active_count > 0
 
         if active_downloads:
             # Step 2: Prompt user for confirmation
@@ -1214,54 +1467,65 @@ class DownloaderApp:
             )
 
             if confirm is None:  # User clicked "Cancel"
+                self.closing = False
                 return  # Do nothing
 
             if confirm:  # User clicked "Yes" → Cancel all active downloads
                 self.log("🔴 Storing queue and exiting...")
-                #if any completed downloads, remove them from the queue
-                self.queue = [task for task in self.queue if task["status"] != "Completed"]
-                #call export_queue function to save the queue to file
-                self.export_queue()           
-                self.update_queue_listbox_threadsafe()
+                #call export_queue function to save the queue to file, it writes only the Queued tasks so completed ones are left out
+                self.export_queue()
                 self.log("🔴 Exiting application...")
-                #stop any threads if running
-                for thread in threading.enumerate():
-                    if thread is not threading.current_thread():
-                        thread.join(timeout=0.1)
-                sys.exit()
 
             else:  #ser clicked "No" → Don't exit
                 self.log("🔴 Exiting without saving")
-                for thread in threading.enumerate():
-                    if thread is not threading.current_thread():
-                        thread.join(timeout=0.1)
-                sys.exit()
-        # ✅ Step 3: Perform Cleanup Before Exit
+        # ✅ Step 3: Perform Cleanup Before Exit, running downloads abort at their next progress report
         self.log("🔴 Closing application...")
-    
-    # ✅ Step 4: Destroy the application window
+        self.shutdown()
+
+        # ✅ Step 4: Destroy the application window, mainloop then returns and the workers are joined after it
         self.master.destroy()
-        sys.exit()
 
     def minimize_to_tray(self):
+        try:
+            self.show_tray_icon()
+        except OSError as e:  # Missing, locked or unreadable logo (PIL's UnidentifiedImageError is an OSError)
+            self.log(f"❌ Could not show the tray icon: {e}", level="error")
+            return  # Keep the window, without a tray icon there would be no way to bring it back
         self.master.withdraw()  # Hide main window
-        self.show_tray_icon()
 
     def show_tray_icon(self):
-        image = Image.open("Assets/logo.ico")
+        """Show the tray icon, creating it and its thread on the first minimize only."""
+        if self.tray_icon is not None:
+            self.tray_icon.visible = True
+            return
+        # convert() decodes the pixels into a new in-memory RGBA image, so the file is closed right away
+        with Image.open(LOGO_PATH) as image:
+            tray_image = image.convert("RGBA")
         menu = Menu(
             item('Show App', self.restore_window,default=True),
-            item('Exit', self.close_application),
+            item('Exit', lambda icon, menu_item: self.master.after(0, self.close_application)),  # Close on the Tk thread
         )
-        self.tray_icon = TrayIcon("YT-DLP GUI", image, "Running in Background", menu)
-        threading.Thread(target=self.tray_icon.run, daemon=True).start()
+        self.tray_icon = TrayIcon("YT-DLP GUI", tray_image, "Running in Background", menu)
+        # run() makes the icon visible once it is set up, then lives until shutdown() stops it
+        self.start_worker(self.tray_icon.run, daemon=False)
 
     def restore_window(self, icon, item):
-        self.master.after(0, self.master.deiconify)
-        self.master.after(0, self.master.focus_force)
+        """Tray menu callback (pystray thread): hand the window work to the Tk thread in one call."""
+        self.master.after(0, self.show_window)
+        self.tray_icon.visible = False  # Hidden, not stopped, so the next minimize reuses it
+
+    def show_window(self):
+        """Bring the main window back from the tray (Tk thread)."""
+        self.master.deiconify()
         self.master.state('zoomed')
-        self.tray_icon.stop()
+        self.master.focus_force()
 if __name__ == "__main__":
         root = tk.Tk()
         app = DownloaderApp(root)
-        root.mainloop()
+        try:
+            root.mainloop()
+        finally:
+            app.shutdown()  # Also when close_application failed early, the non-daemon tray thread would outlive the window
+            # The window is gone, give aborted downloads and the queue export a moment to finish
+            if not app.join_workers():
+                os._exit(0)  # A download never reached its next hook, end it instead of lingering without a window
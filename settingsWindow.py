@@ -2,6 +2,99 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog,scrolledtext
 import json
 import os
+import copy
+import hashlib
+from contextlib import contextmanager, suppress
+#orjson parses presets, queues and info.json files and hashes options several times faster when it is installed
+try:
+    from orjson import loads as json_loads, dumps as orjson_dumps, OPT_SORT_KEYS
+except ImportError:
+    from json import loads as json_loads
+    orjson_dumps = None
+
+FORMAT_OPTIONS = {  # Format dropdown label -> yt-dlp format string, shared with the main window
+    "All Available Formats": "all",
+    "Best (Video+Audio)": "best",
+    "Best Video+Audio (Muxed)": "bv*+ba/best",
+    "Best ≤720p": "bestvideo[height<=720]+bestaudio/best[height<=720]",
+    "Best ≤480p": "bestvideo[height<=480]+bestaudio/best[height<=480]",
+    "Worst Video+Audio (Muxed)": "worst",
+    "Best Video Only": "bestvideo",
+    "Worst Video Only": "worstvideo",
+    "Best Video (any stream)": "bestvideo*",
+    "Worst Video (any stream)": "worstvideo*",
+    "Best Audio Only": "bestaudio",
+    "Worst Audio Only": "worstaudio",
+    "Best Audio (any stream)": "bestaudio*",
+    "Worst Audio (any stream)": "worstaudio*",
+    "Smallest File": "best -S +size,+br,+res,+fps",
+}
+CUSTOM_FORMAT_LABEL = "Custom (enter below)"  # Dropdown entry that keeps the format typed in the entry
+SB_CATEGORIES = (  # Every SponsorBlock category offered for removing and marking
+    "sponsor", "intro", "outro", "selfpromo", "interaction",
+    "music_offtopic", "preview", "filler", "exclusive_access",
+    "poi_highlight", "poi_nonhighlight",
+)
+SB_CHAPTER_TITLE = '[SponsorBlock]: %(category_names)l'  # yt-dlp's default title for SponsorBlock chapters
+LIVE_UPDATE_TAG = "SettingsLiveUpdate"  # Bind tag carrying the shared <KeyRelease> handler of all text fields
+LIVE_UPDATE_DELAY_MS = 150  # Quiet time after the last edit before the options and preview are rebuilt
+PRESET_CACHE = {}  # preset path -> (mtime_ns, parsed options, options_digest), shared by the main and settings windows
+PRESET_LIST_CACHE = {}  # preset folder -> (mtime_ns, preset names)
+
+def dump_options(opts):
+    """Indented JSON of an options dict as UTF-8 bytes, for preset and queue files and the preview."""
+    # Always the stdlib encoder, so the files look the same whether or not orjson is installed.
+    # default=dict serializes the ChainMap task options
+    return json.dumps(opts, indent=4, default=dict).encode("utf-8")
+
+def options_digest(opts):
+    """Stable 16-byte digest of an options mapping, equal for equal options."""
+    if orjson_dumps is not None:
+        data = orjson_dumps(opts, default=str, option=OPT_SORT_KEYS)
+    else:
+        data = json.dumps(opts, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+def load_json_file(path):
+    """Read a JSON file with a single read call and parse it."""
+    with open(path, "rb") as f:
+        return json_loads(f.read())
+
+def dump_json_file(path, data):
+    """Serialize data to a JSON file with a single write call."""
+    payload = dump_options(data)
+    with open(path, "wb") as f:
+        f.write(payload)
+
+def load_preset_file(path):
+    """Parse a preset file, reusing the cached result while its mtime is unchanged. Do not mutate the result."""
+    return cached_preset(path)[1]
+
+def preset_file_digest(path):
+    """options_digest() of a preset file, cached alongside its parsed options."""
+    return cached_preset(path)[2]
+
+def cached_preset(path):
+    """PRESET_CACHE entry for path, re-read only after the file's mtime changed."""
+    mtime = os.stat(path).st_mtime_ns
+    cached = PRESET_CACHE.get(path)
+    if cached is None or cached[0] != mtime:
+        opts = load_json_file(path)
+        cached = PRESET_CACHE[path] = (mtime, opts, options_digest(opts))  # Swapped in whole, safe to read from any thread
+    return cached
+
+def list_preset_names(preset_dir):
+    """Names of the presets in preset_dir, rescanned only when the folder's mtime changes."""
+    try:
+        mtime = os.stat(preset_dir).st_mtime_ns  # Changes whenever a preset is added, removed or replaced
+    except FileNotFoundError:
+        return []
+    cached = PRESET_LIST_CACHE.get(preset_dir)
+    if cached is None or cached[0] != mtime:
+        with os.scandir(preset_dir) as entries:
+            names = [entry.name[:-5] for entry in entries if entry.name.endswith(".json") and entry.is_file()]
+        cached = PRESET_LIST_CACHE[preset_dir] = (mtime, names)
+    return cached[1]
 
 class SettingsWindow:
     def __init__(self, master, initial_opts=None,global_change=False):
@@ -12,10 +105,14 @@ class SettingsWindow:
             self.master.title("yt-dlp Settings")
         self.master.geometry("1000x700")
         self.master.transient(master)
-        self.master.grab_set()
         self.widgets = {}
         self.intial_opts = initial_opts or {}
         self.is_loading = False
+        self.pending_save = None  # after() id of the scheduled live-update save, if any
+        self.preview_json = None  # Text currently shown in the preview box
+        # One class binding for every entry and spinbox, rebound to this window each time one opens
+        self.master.bind_class(LIVE_UPDATE_TAG, "<KeyRelease>", self.schedule_save)
+        self.loaded_opts = None  # The ydl_opts dict the widgets were last loaded from
         self.preset_dir = "settings_presets"
         os.makedirs(self.preset_dir, exist_ok=True)
         self.main_panel = ttk.Panedwindow(self.master, orient=tk.HORIZONTAL)
@@ -32,7 +129,7 @@ class SettingsWindow:
         self.preview_text = scrolledtext.ScrolledText(master=self.right_panel, wrap=tk.WORD,background="#222",foreground="white")
         self.preview_text.pack(fill="both", expand=True, padx=10, pady=10)
         self.preview_text.insert("1.0", "Settings Preview:\n")
-        self.preview_text.insert("2.0", json.dumps(initial_opts, indent=4) if initial_opts else "No settings loaded.")
+        self.preview_text.insert("2.0", dump_options(initial_opts).decode("utf-8") if initial_opts else "No settings loaded.")
         self.preview_text.config(state="disabled")
         self.ydl_opts = initial_opts or {}
         self.notebook_frame = ttk.Frame(self.left_panel)
@@ -56,7 +153,7 @@ class SettingsWindow:
         # Initialize the notebook tabs
         self.notebook = ttk.Notebook(self.notebook_frame)        
         self.notebook.pack(fill="both", expand=True, padx=10, pady=10)
-        self.notebook.bind("<<NotebookTabChanged>>", lambda event: [self.load_values(), self.update_preview()])
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
         self.video_exts = ["mp4", "webm", "mkv", "flv", "avi"]
         self.audio_exts = ["mp3", "m4a", "aac", "wav", "ogg", "opus"]
         self.final_ext_options = ['original'] + self.video_exts + self.audio_exts
@@ -82,26 +179,23 @@ class SettingsWindow:
         self.refresh_preset_list()
         self.load_values()
         self.update_preview(initial_opts)
+        self.master.grab_set()  # Modal only once every tab is built and loaded
 
     def refresh_preset_list(self):
-        files = [f[:-5] for f in os.listdir(self.preset_dir) if f.endswith(".json")]
-        self.preset_dropdown["values"] = files + ["New/Unsaved"]
+        self.preset_dropdown["values"] = list_preset_names(self.preset_dir) + ["New/Unsaved"]
         self.preset_var.set("New/Unsaved")
     def on_preset_selected(self, event=None):
         name = self.preset_var.get()
         if name == "New/Unsaved":
             return
+        self.cancel_pending_save()  # A late live-update save would write the old fields over the loaded preset
         path = os.path.join(self.preset_dir, f"{name}.json")
         try:
-            with open(path, "r") as f:
-                self.is_loading = True
-                self.ydl_opts = json.load(f)
-            self.load_values()
-            self.update_preview()
+            with self.loading():
+                self.ydl_opts = copy.deepcopy(load_preset_file(path))  # Private copy, the cache stays untouched
+                self.load_values()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load preset: {e}")
-        finally:
-            self.is_loading = False
 
 
     def add_browse_dir(self, parent, key, label, row):
@@ -159,28 +253,10 @@ class SettingsWindow:
         row = 0
 
         ttk.Label(tab, text="Format:").grid(row=row, column=0, sticky="w", padx=10, pady=2)
-        format_options = {
-            "All Available Formats": "all",
-            "Best (Video+Audio)": "best",
-            "Best Video+Audio (Muxed)": "bv*+ba/best",
-            "Best ≤720p": "bestvideo[height<=720]+bestaudio/best[height<=720]",
-            "Best ≤480p": "bestvideo[height<=480]+bestaudio/best[height<=480]",
-            "Worst Video+Audio (Muxed)": "worst",
-            "Best Video Only": "bestvideo",
-            "Worst Video Only": "worstvideo",
-            "Best Video (any stream)": "bestvideo*",
-            "Worst Video (any stream)": "worstvideo*",
-            "Best Audio Only": "bestaudio",
-            "Worst Audio Only": "worstaudio",
-            "Best Audio (any stream)": "bestaudio*",
-            "Worst Audio (any stream)": "worstaudio*",
-            "Smallest File": "best -S +size,+br,+res,+fps",
-            "Custom (enter below)": "Custom"
-        }
 
         self.format_var = tk.StringVar(value="Best Video+Audio (Muxed)")
         self.bind_live_update(self.format_var)
-        self.widgets['format_dropdown'] = ttk.Combobox(tab, textvariable=self.format_var, values=list(format_options.keys()))
+        self.widgets['format_dropdown'] = ttk.Combobox(tab, textvariable=self.format_var, values=(*FORMAT_OPTIONS, CUSTOM_FORMAT_LABEL))
         self.widgets['format_dropdown'].grid(row=row, column=1, sticky="ew", padx=10)
         row += 1
 
@@ -190,7 +266,7 @@ class SettingsWindow:
 
         # Custom format entry
         self.widgets['format'] = ttk.Entry(tab)
-        self.widgets['format'].insert(0, format_options["Best (Video+Audio)"])
+        self.widgets['format'].insert(0, FORMAT_OPTIONS["Best (Video+Audio)"])
         self.widgets['format'].grid(row=row, column=0, columnspan=2, sticky="ew", padx=10, pady=2)
         row += 1
 
@@ -214,8 +290,8 @@ class SettingsWindow:
         # Sync dropdown and entry
         def update_format_entry(event=None):
             selected_label = self.format_var.get()
-            value = format_options.get(selected_label, )
-            if selected_label != "Custom (enter below)":
+            value = FORMAT_OPTIONS.get(selected_label)
+            if value is not None:  # Custom or a typed label keeps the format entry as it is
                 self.widgets['format'].delete(0, tk.END)
                 self.widgets['format'].insert(0, value)
             # Adapt final extension options
@@ -497,43 +573,20 @@ class SettingsWindow:
         bottom_frame.pack(fill="both", expand=True, padx=10, pady=10)
         bottom_frame.columnconfigure(1, weight=1)
 
-        categories = [
-            "sponsor", "intro", "outro", "selfpromo", "interaction",
-            "music_offtopic", "preview", "filler", "exclusive_access",
-            "poi_highlight", "poi_nonhighlight"
-        ]
-
-        # SponsorBlock Remove
-        row = 0
-        ttk.Label(top_frame, text="Remove Categories:").grid(row=row, column=0, sticky="w", pady=5)
-        self.widgets['sponsorblock_remove'] = {}
-        column = 1
-        for cat in categories:
-            var = tk.BooleanVar()
-            chk = ttk.Checkbutton(top_frame, text=cat, variable=var)
-            self.bind_live_update(var)
-            chk.grid(row=row, column=column, sticky="w", padx=5)
-            self.widgets['sponsorblock_remove'][cat] = var
-            column += 1
-            if column > 5:
-                column = 1
-                row += 1
-        row += 1
-
-        # SponsorBlock Mark
-        ttk.Label(top_frame, text="Mark Categories:").grid(row=row, column=0, sticky="w", pady=5)
-        self.widgets['sponsorblock_mark'] = {}
-        column = 1
-        for cat in categories:
-            var = tk.BooleanVar()
-            chk = ttk.Checkbutton(top_frame, text=cat, variable=var)
-            self.bind_live_update(var)
-            chk.grid(row=row, column=column, sticky="w", padx=5)
-            self.widgets['sponsorblock_mark'][cat] = var
-            column += 1
-            if column > 5:
-                column = 1
-                row += 1
+        # SponsorBlock Remove and Mark, both grids filled in one pass, five categories per row
+        mark_row = (len(SB_CATEGORIES) - 1) // 5 + 1  # First row below the Remove grid
+        ttk.Label(top_frame, text="Remove Categories:").grid(row=0, column=0, sticky="w", pady=5)
+        ttk.Label(top_frame, text="Mark Categories:").grid(row=mark_row, column=0, sticky="w", pady=5)
+        self.sb_vars = []  # (category, remove var, mark var)
+        for index, cat in enumerate(SB_CATEGORIES):
+            row, column = divmod(index, 5)
+            remove_var = tk.BooleanVar()
+            mark_var = tk.BooleanVar()
+            ttk.Checkbutton(top_frame, text=cat, variable=remove_var).grid(row=row, column=column + 1, sticky="w", padx=5)
+            ttk.Checkbutton(top_frame, text=cat, variable=mark_var).grid(row=mark_row + row, column=column + 1, sticky="w", padx=5)
+            self.bind_live_update(remove_var)
+            self.bind_live_update(mark_var)
+            self.sb_vars.append((cat, remove_var, mark_var))
 
         # Chapter title format
         self.widgets['sponsorblock_chapter_title'] = self.add_labeled_entry(
@@ -562,118 +615,149 @@ class SettingsWindow:
     # code for dynamic updating and saving of settings 
     def bind_live_update(self, widget):
         if isinstance(widget, ttk.Entry) or isinstance(widget, tk.Spinbox):
-            widget.bind("<KeyRelease>", lambda e: self.save())
+            widget.bindtags(widget.bindtags() + (LIVE_UPDATE_TAG,))  # Shares the one <KeyRelease> binding made in __init__
         elif isinstance(widget, ttk.Combobox):
-            widget.bind("<<ComboboxSelected>>", lambda e: self.save())
+            widget.bind("<<ComboboxSelected>>", self.schedule_save)
         elif isinstance(widget, tk.BooleanVar):
-            widget.trace_add("write", lambda *args: self.save())
-        
-    def load_values(self):
+            widget.trace_add("write", self.schedule_save)
+
+    def schedule_save(self, *args):
+        """Debounce live updates: restart the timer so a burst of edits ends in a single save().
+
+        Bound directly as the event and trace callback, so it ignores the event or trace arguments.
+        """
+        if self.is_loading:
+            return
+        self.cancel_pending_save()
+        self.pending_save = self.master.after(LIVE_UPDATE_DELAY_MS, self.flush_save)
+
+    def flush_save(self):
+        self.pending_save = None
+        self.save()
+
+    def cancel_pending_save(self):
+        if self.pending_save is not None:
+            self.master.after_cancel(self.pending_save)
+            self.pending_save = None
+
+    @contextmanager
+    def loading(self):
+        """Suppress live-update saves while widgets are filled in from code, nested blocks keep it on."""
+        was_loading = self.is_loading
         self.is_loading = True
         try:
-            postprocessors = self.ydl_opts.get("postprocessors", [])
-            pp_map = {pp["key"]: pp for pp in postprocessors if "key" in pp}
-
-            # SponsorBlock categories — set early from top-level keys
-            for sb_key in ("sponsorblock_remove", "sponsorblock_mark"):
-                enabled = self.ydl_opts.get(sb_key, [])
-                for cat_key, var in self.widgets.get(sb_key, {}).items():
-                    var.set(cat_key in enabled)
-
-
-            # Main widget loading
-            for key, widget in self.widgets.items():
-                if key in ("sponsorblock_remove", "sponsorblock_mark"):
-                    continue  # already handled above
-
-                value = self.ydl_opts.get(key)
-
-                if key == "output_mode":
-                    if self.ydl_opts.get("verbose"):
-                        widget.set("verbose")
-                    elif self.ydl_opts.get("quiet"):
-                        widget.set("quiet")
-                    else:
-                        widget.set("normal")
-
-                elif isinstance(widget, tk.BooleanVar):
-                    widget.set(bool(value))
-
-                elif isinstance(widget, ttk.Combobox):
-                    if key == "format":
-                        # Special handling for format dropdown
-                        if value in self.format_var.get():
-                            widget.set(value)
-                        else:
-                            widget.set("Custom (enter below)")
-                    elif key == "final_ext":
-                        widget.set(value if value and value in self.final_ext_options else "original")
-                    else:
-                        widget.set(str(value) if value is not None else "")
-
-                elif isinstance(widget, ttk.Entry):
-                    widget.delete(0, tk.END)
-                    widget.insert(0, str(value) if value is not None else "")
-
-                elif isinstance(widget, dict) and "widget" in widget and "default" in widget:
-                    try:
-                        spinbox = widget["widget"]
-                        default_value = widget["default"]  # Fetch the default value from the dictionary
-                        spinbox.delete(0, tk.END)
-                        spinbox.insert(0, int(value) if value is not None else int(default_value))
-                    except ValueError:
-                        spinbox.delete(0, tk.END)
-                        spinbox.insert(0, default_value)
-
-            # Postprocessor-related states
-            if "FFmpegMetadata" in pp_map:
-                self.widgets.get("addmetadata", tk.BooleanVar()).set(pp_map["FFmpegMetadata"].get("add_metadata", False))
-                self.widgets.get("add_chapters", tk.BooleanVar()).set(pp_map["FFmpegMetadata"].get("add_chapters", False))
-
-            if "FFmpegExtractAudio" in pp_map:
-                self.widgets.get("final_ext", ttk.Combobox()).set(pp_map["FFmpegExtractAudio"].get("preferredcodec", ""))
-
-            elif "FFmpegVideoConvertor" in pp_map:
-                self.widgets.get("final_ext", ttk.Combobox()).set(pp_map["FFmpegVideoConvertor"].get("preferedformat", ""))
-
-            if "EmbedThumbnail" in pp_map:
-                self.widgets.get("embedthumbnail", tk.BooleanVar()).set(True)
-                self.widgets.get("writethumbnail", tk.BooleanVar()).set(True)
-
-            # Load SponsorBlock API — from any matching pp with "api"
-            for pp in postprocessors:
-                if pp.get("key") == "SponsorBlock" and "api" in pp:
-                    self.widgets.get("sponsorblock_api", ttk.Entry()).delete(0, tk.END)
-                    self.widgets.get("sponsorblock_api", ttk.Entry()).insert(0, pp.get("api"))
-                    break  # only load first matching one            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load values: {e}")
+            yield
         finally:
-            self.is_loading = False
-            self.update_preview(self.ydl_opts)
+            self.is_loading = was_loading
+
+    def on_tab_changed(self, event=None):
+        """Sync the widgets on a tab switch, reloading them only if the options changed since the last load."""
+        if self.pending_save is not None:
+            self.cancel_pending_save()
+            self.save()  # Apply edits still waiting for the debounce before the widgets are reloaded
+        if self.ydl_opts is not self.loaded_opts:
+            self.load_values()
+
+    def load_values(self):
+        self.loaded_opts = self.ydl_opts
+        with self.loading():
+            try:
+                postprocessors = self.ydl_opts.get("postprocessors", [])
+                pp_map = {pp["key"]: pp for pp in postprocessors if "key" in pp}
+
+                # SponsorBlock categories — set early from top-level keys
+                removed = self.ydl_opts.get("sponsorblock_remove") or ()
+                marked = self.ydl_opts.get("sponsorblock_mark") or ()
+                for cat, remove_var, mark_var in self.sb_vars:
+                    remove_var.set(cat in removed)
+                    mark_var.set(cat in marked)
+
+                # Main widget loading
+                for key, widget in self.widgets.items():
+                    value = self.ydl_opts.get(key)
+
+                    if key == "output_mode":
+                        if self.ydl_opts.get("verbose"):
+                            widget.set("verbose")
+                        elif self.ydl_opts.get("quiet"):
+                            widget.set("quiet")
+                        else:
+                            widget.set("normal")
+
+                    elif isinstance(widget, tk.BooleanVar):
+                        widget.set(bool(value))
+
+                    elif isinstance(widget, ttk.Combobox):
+                        if key == "format":
+                            # Special handling for format dropdown
+                            if value in self.format_var.get():
+                                widget.set(value)
+                            else:
+                                widget.set("Custom (enter below)")
+                        elif key == "final_ext":
+                            widget.set(value if value and value in self.final_ext_options else "original")
+                        else:
+                            widget.set(str(value) if value is not None else "")
+
+                    elif isinstance(widget, ttk.Entry):
+                        widget.delete(0, tk.END)
+                        widget.insert(0, str(value) if value is not None else "")
+
+                    elif isinstance(widget, dict) and "widget" in widget and "default" in widget:
+                        try:
+                            spinbox = widget["widget"]
+                            default_value = widget["default"]  # Fetch the default value from the dictionary
+                            spinbox.delete(0, tk.END)
+                            spinbox.insert(0, int(value) if value is not None else int(default_value))
+                        except ValueError:
+                            spinbox.delete(0, tk.END)
+                            spinbox.insert(0, default_value)
+
+                # Postprocessor-related states, keys without a widget are skipped (no throwaway variables or widgets)
+                def set_widget(key, value):
+                    widget = self.widgets.get(key)
+                    if widget is not None:
+                        widget.set(value)
+
+                if "FFmpegMetadata" in pp_map:
+                    set_widget("addmetadata", pp_map["FFmpegMetadata"].get("add_metadata", False))
+                    set_widget("add_chapters", pp_map["FFmpegMetadata"].get("add_chapters", False))
+
+                if "FFmpegExtractAudio" in pp_map:
+                    set_widget("final_ext", pp_map["FFmpegExtractAudio"].get("preferredcodec", ""))
+
+                elif "FFmpegVideoConvertor" in pp_map:
+                    set_widget("final_ext", pp_map["FFmpegVideoConvertor"].get("preferedformat", ""))
+
+                if "EmbedThumbnail" in pp_map:
+                    set_widget("embedthumbnail", True)
+                    set_widget("writethumbnail", True)
+
+                # Load SponsorBlock API — from any matching pp with "api"
+                api_entry = self.widgets.get("sponsorblock_api")
+                for pp in postprocessors:
+                    if api_entry is not None and pp.get("key") == "SponsorBlock" and "api" in pp:
+                        api_entry.delete(0, tk.END)
+                        api_entry.insert(0, pp.get("api"))
+                        break  # only load first matching one
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to load values: {e}")
+        self.update_preview(self.ydl_opts)
             
     def get_ydl_opts(self):
         opts = {}
         postprocessors = []
 
         #Handling sponsorblock out of main loop
-        sponsorblock_remove = []
-        sponsorblock_mark = []
-        for key, widget in self.widgets.get("sponsorblock_remove", {}).items():
-            if widget.get():
-                sponsorblock_remove.append(key)
-        for key, widget in self.widgets.get("sponsorblock_mark", {}).items():
-            if widget.get():
-                sponsorblock_mark.append(key)
+        sponsorblock_remove = [cat for cat, remove_var, _ in self.sb_vars if remove_var.get()]
+        sponsorblock_mark = [cat for cat, _, mark_var in self.sb_vars if mark_var.get()]
         if sponsorblock_remove:
             opts["sponsorblock_remove"] = sponsorblock_remove
         if sponsorblock_mark:
             opts["sponsorblock_mark"] = sponsorblock_mark
         # 1. Collect from widgets
         for key, widget in self.widgets.items():
-            if key == "sponsorblock_remove" or key == "sponsorblock_mark":
-                continue
-            elif key == "output_mode":
+            if key == "output_mode":
                 mode = widget.get()
                 if mode == "verbose":
                     opts["verbose"] = True
@@ -691,8 +775,9 @@ class SettingsWindow:
             elif isinstance(widget, dict) and "widget" in widget and "default" in widget:
                 spinbox = widget["widget"]
                 default_value = widget["default"]
+                text = spinbox.get().strip()  # One Tk round trip per spinbox
                 try:
-                    opts[key] = int(spinbox.get().strip()) if spinbox.get().strip() else default_value
+                    opts[key] = int(text) if text else default_value
                 except ValueError:
                     opts[key] = default_value
 
@@ -774,7 +859,7 @@ class SettingsWindow:
             })
             postprocessors.append({
                 "key":"ModifyChapters",
-                "sponsorblock_chapter_title":opts.get("sponsorblock_chapter_title",'[SponsorBlock]: %(category_names)l'),
+                "sponsorblock_chapter_title":opts.get("sponsorblock_chapter_title", SB_CHAPTER_TITLE),
                 'remove_chapters_patterns': [],
                 'remove_ranges': [],                
                 'remove_sponsor_segments': opts.get("sponsorblock_remove", []),
@@ -794,9 +879,12 @@ class SettingsWindow:
 
     def update_preview(self, opts=None):
         if hasattr(self, "preview_text"):
+            text = dump_options(opts or self.ydl_opts).decode("utf-8")
+            if text == self.preview_json:
+                return  # Same options as on screen, leave the widget alone
+            self.preview_json = text
             self.preview_text.config(state="normal")
-            self.preview_text.delete("1.0", tk.END)
-            self.preview_text.insert("1.0", json.dumps(opts or self.ydl_opts, indent=4))
+            self.preview_text.replace("1.0", tk.END, text)
             self.preview_text.config(state="disabled")
 
     def save(self):
@@ -808,10 +896,12 @@ class SettingsWindow:
         self.mark_as_unsaved_if_modified()
 
     def save_and_close(self):
+        self.cancel_pending_save()
         self.save()
         self.master.destroy()
 
     def cancel(self):
+        self.cancel_pending_save()  # Never run a save against destroyed widgets
         self.master.destroy()
         self.master.grab_release()
         self.ydl_opts = self.intial_opts or {}
@@ -821,8 +911,7 @@ class SettingsWindow:
         if current_name in ["New/Unsaved", ""]:
             return  # Already unsaved
         try:
-            with open(os.path.join(self.preset_dir, f"{current_name}.json")) as f:
-                saved_opts = json.load(f)
+            saved_opts = load_preset_file(os.path.join(self.preset_dir, f"{current_name}.json"))
             if saved_opts != self.ydl_opts:
                 self.preset_var.set("New/Unsaved")
         except:
@@ -835,8 +924,19 @@ class SettingsWindow:
         if not name:
             return
         file_path = os.path.join(self.preset_dir, f"{name}.json")
-        with open(file_path, "w") as f:
-            json.dump(self.get_ydl_opts(), f, indent=4)
+        data = dump_options(self.get_ydl_opts())
+        # One buffered write into a temporary file that is swapped in, so a failed save never leaves half a preset
+        tmp_path = file_path + ".tmp"
+        try:
+            with open(tmp_path, "wb", buffering=1 << 20) as f:
+                f.write(data)
+            os.replace(tmp_path, file_path)
+        except OSError as e:
+            # Don't leave the half-written temporary file next to the presets
+            with suppress(OSError):
+                os.remove(tmp_path)
+            messagebox.showerror("Error", f"Failed to save preset: {e}")
+            return
         messagebox.showinfo("Saved", f"Preset '{name}' saved successfully.")
         self.refresh_preset_list()
         self.preset_var.set(name)